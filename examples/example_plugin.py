@@ -17,11 +17,78 @@ To use this plugin:
 
 from __future__ import annotations
 
+import logging
 from typing import Any
 
 from deckhand.orchestrator.events import build_event
 from deckhand.plugins.registry import PluginRegistry
 
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# PAYLOAD SCHEMAS
+# ============================================================================
+# Schemas are registered as metadata (see GET /actions). The HTTP endpoints
+# reject payloads with missing required fields or wrong types; handlers can
+# also be called directly, so they still check the fields they need. Range
+# limits are applied by the handlers (brightness is clamped to 0-100).
+
+TURN_ON_SCHEMA: dict[str, Any] = {
+    "room": {"type": "string", "required": True, "description": "Room name"},
+    "brightness": {
+        "type": "integer",
+        "required": False,
+        "default": 100,
+        "description": "Brightness level 0-100",
+    },
+}
+
+TURN_OFF_SCHEMA: dict[str, Any] = {
+    "room": {"type": "string", "required": True, "description": "Room name"},
+}
+
+SET_BRIGHTNESS_SCHEMA: dict[str, Any] = {
+    "room": {"type": "string", "required": True},
+    "brightness": {"type": "integer", "required": True},
+}
+
+STATUS_WEBHOOK_SCHEMA: dict[str, Any] = {
+    "room": {"type": "string", "required": True},
+    "on": {"type": "boolean", "required": True},
+    "brightness": {"type": "integer", "required": False},
+}
+
+# Event sources are invariant per action/signal, so build them once.
+# build_event copies the fields, so these are never mutated.
+TURN_ON_SOURCE = {"kind": "action", "id": "lights.turn_on"}
+TURN_OFF_SOURCE = {"kind": "action", "id": "lights.turn_off"}
+SET_BRIGHTNESS_SOURCE = {"kind": "action", "id": "lights.set_brightness"}
+STATUS_WEBHOOK_SOURCE = {"kind": "signal", "id": "lights.status_webhook"}
+
+
+def _room(payload: dict[str, Any]) -> str:
+    """Return the required room name, raising ValueError if missing or empty."""
+    room = payload.get("room")
+    if not room:
+        raise ValueError("room is required")
+    return str(room)
+
+
+def _required(payload: dict[str, Any], name: str) -> Any:
+    """Return a required payload field, raising ValueError if it is missing."""
+    value = payload.get(name)
+    if value is None:
+        raise ValueError(f"{name} is required")
+    return value
+
+
+def _brightness(value: Any) -> int:
+    """Clamp a brightness value to 0-100, falling back to 100 if not numeric."""
+    if not isinstance(value, (int, float)):
+        return 100
+    return max(0, min(100, int(value)))
+
 
 def register(registry: PluginRegistry) -> None:
     """
@@ -41,50 +108,33 @@ def register(registry: PluginRegistry) -> None:
         - room (str, required): Room name (e.g., "living_room", "bedroom")
         - brightness (int, optional): Brightness level 0-100 (default: 100)
         """
-        # Validate required fields
-        room = payload.get("room")
-        if not room:
-            raise ValueError("room is required")
-        room = str(room)
-        
-        # Get optional fields with defaults
-        brightness = payload.get("brightness", 100)
-        if not isinstance(brightness, (int, float)):
-            brightness = 100
-        brightness = max(0, min(100, int(brightness)))  # Clamp to 0-100
+        room = _room(payload)
+        # Brightness defaults to 100 and is clamped to 0-100
+        brightness = _brightness(payload.get("brightness", 100))
         
         # In a real plugin, you would call your lights API here
         # For this example, we'll just update state
-        print(f"[Lights Plugin] Turning on lights in {room} at {brightness}% brightness")
+        logger.info("Turning on lights in %s at %s%% brightness", room, brightness)
         
-        # Update state for indicator buttons
-        await registry.state.set_state(
+        # Update state for indicator buttons and notify clients with a
+        # lights.changed event, sent to subscribers in a single broadcast
+        await registry.state.set_state_and_emit(
             f"lights.{room}.state",
             {"on": True, "brightness": brightness},
-            source={"kind": "action", "id": "lights.turn_on"},
+            build_event(
+                "lights.changed",
+                TURN_ON_SOURCE,
+                {"room": room, "state": "on", "brightness": brightness},
+            ),
+            source=TURN_ON_SOURCE,
         )
-        
-        # Emit custom event to notify clients
-        await registry.events.emit(build_event(
-            "lights.changed",
-            {"kind": "action", "id": "lights.turn_on"},
-            {"room": room, "state": "on", "brightness": brightness},
-        ))
     
     # Register the action with metadata
     registry.actions.register(
         "lights.turn_on",
         turn_on_lights,
         description="Turn on lights in a room with optional brightness control",
-        payload_schema={
-            "room": {"type": "string", "required": True, "description": "Room name"},
-            "brightness": {
-                "type": "integer",
-                "required": False,
-                "default": 100,
-                "description": "Brightness level 0-100",
-            },
-        },
+        payload_schema=TURN_ON_SCHEMA,
     )
     
     # ============================================================================
@@ -97,34 +147,27 @@ def register(registry: PluginRegistry) -> None:
         Expected payload:
         - room (str, required): Room name
         """
-        room = payload.get("room")
-        if not room:
-            raise ValueError("room is required")
-        room = str(room)
+        room = _room(payload)
         
-        print(f"[Lights Plugin] Turning off lights in {room}")
+        logger.info("Turning off lights in %s", room)
         
-        # Update state
-        await registry.state.set_state(
+        # Update state and emit event
+        await registry.state.set_state_and_emit(
             f"lights.{room}.state",
             {"on": False, "brightness": 0},
-            source={"kind": "action", "id": "lights.turn_off"},
+            build_event(
+                "lights.changed",
+                TURN_OFF_SOURCE,
+                {"room": room, "state": "off"},
+            ),
+            source=TURN_OFF_SOURCE,
         )
-        
-        # Emit event
-        await registry.events.emit(build_event(
-            "lights.changed",
-            {"kind": "action", "id": "lights.turn_off"},
-            {"room": room, "state": "off"},
-        ))
     
     registry.actions.register(
         "lights.turn_off",
         turn_off_lights,
         description="Turn off lights in a room",
-        payload_schema={
-            "room": {"type": "string", "required": True, "description": "Room name"},
-        },
+        payload_schema=TURN_OFF_SCHEMA,
     )
     
     # ============================================================================
@@ -138,43 +181,32 @@ def register(registry: PluginRegistry) -> None:
         - room (str, required): Room name
         - brightness (int, required): Brightness level 0-100
         """
-        room = payload.get("room")
-        brightness = payload.get("brightness")
-        
-        if not room:
-            raise ValueError("room is required")
-        if brightness is None:
-            raise ValueError("brightness is required")
+        room = _room(payload)
+        brightness = _brightness(_required(payload, "brightness"))
         
-        room = str(room)
-        brightness = max(0, min(100, int(brightness)))
-        
-        print(f"[Lights Plugin] Setting brightness in {room} to {brightness}%")
+        logger.info("Setting brightness in %s to %s%%", room, brightness)
         
         # Get current state to preserve 'on' status
         current_state = registry.state.get_state(f"lights.{room}.state")
         is_on = current_state["value"]["on"] if current_state else True
         
-        await registry.state.set_state(
+        # Update state and emit event
+        await registry.state.set_state_and_emit(
             f"lights.{room}.state",
             {"on": is_on, "brightness": brightness},
-            source={"kind": "action", "id": "lights.set_brightness"},
+            build_event(
+                "lights.changed",
+                SET_BRIGHTNESS_SOURCE,
+                {"room": room, "brightness": brightness},
+            ),
+            source=SET_BRIGHTNESS_SOURCE,
         )
-        
-        await registry.events.emit(build_event(
-            "lights.changed",
-            {"kind": "action", "id": "lights.set_brightness"},
-            {"room": room, "brightness": brightness},
-        ))
     
     registry.actions.register(
         "lights.set_brightness",
         set_brightness,
         description="Set brightness level for lights in a room",
-        payload_schema={
-            "room": {"type": "string", "required": True},
-            "brightness": {"type": "integer", "required": True, "minimum": 0, "maximum": 100},
-        },
+        payload_schema=SET_BRIGHTNESS_SCHEMA,
     )
     
     # ============================================================================
@@ -192,43 +224,29 @@ def register(registry: PluginRegistry) -> None:
         - on (bool, required): Whether lights are on
         - brightness (int, optional): Current brightness level
         """
-        room = payload.get("room")
-        on_state = payload.get("on")
-        
-        if not room:
-            raise ValueError("room is required")
-        if on_state is None:
-            raise ValueError("on is required")
-        
-        room = str(room)
-        on_state = bool(on_state)
+        room = _room(payload)
+        on_state = bool(_required(payload, "on"))
         brightness = payload.get("brightness", 100 if on_state else 0)
         
-        print(f"[Lights Plugin] Webhook: {room} lights are {'on' if on_state else 'off'}")
+        logger.debug("Webhook: %s lights are %s", room, "on" if on_state else "off")
         
-        # Update state from external source
-        await registry.state.set_state(
+        # Update state from external source so clients know it changed externally
+        await registry.state.set_state_and_emit(
             f"lights.{room}.state",
             {"on": on_state, "brightness": brightness},
-            source={"kind": "signal", "id": "lights.status_webhook"},
+            build_event(
+                "lights.changed",
+                STATUS_WEBHOOK_SOURCE,
+                {"room": room, "state": "on" if on_state else "off", "brightness": brightness},
+            ),
+            source=STATUS_WEBHOOK_SOURCE,
         )
-        
-        # Emit event so clients know state changed externally
-        await registry.events.emit(build_event(
-            "lights.changed",
-            {"kind": "signal", "id": "lights.status_webhook"},
-            {"room": room, "state": "on" if on_state else "off", "brightness": brightness},
-        ))
     
     registry.signals.register(
         "lights.status_webhook",
         lights_status_webhook,
         description="Handle webhook from lights system reporting status changes",
-        payload_schema={
-            "room": {"type": "string", "required": True},
-            "on": {"type": "boolean", "required": True},
-            "brightness": {"type": "integer", "required": False},
-        },
+        payload_schema=STATUS_WEBHOOK_SCHEMA,
     )
 
 
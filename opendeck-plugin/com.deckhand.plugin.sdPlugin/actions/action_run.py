@@ -12,6 +12,7 @@ from typing import Any
 
 import websockets.asyncio.client
 
+from actions.flash import cancel_restore, restore_title_later
 from bridge import DeckhandBridge
 
 logger = logging.getLogger("deckhand-action-run")
@@ -20,10 +21,14 @@ logger = logging.getLogger("deckhand-action-run")
 class ActionRunHandler:
     """Handles com.deckhand.action.run action instances."""
 
+    # Deckhand event types this handler reacts to
+    DECKHAND_EVENTS: frozenset[str] = frozenset()
+
     def __init__(self, bridge: DeckhandBridge) -> None:
         self.bridge = bridge
 
     async def on_will_appear(self, ws: websockets.asyncio.client.ClientConnection, context: str, settings: dict[str, Any]) -> None:
+        cancel_restore(context)
         action_name = settings.get("action_name", "")
         if action_name:
             await _set_title(ws, context, action_name.split(".")[-1])
@@ -31,7 +36,7 @@ class ActionRunHandler:
             await _set_title(ws, context, "No Action")
 
     async def on_will_disappear(self, context: str) -> None:
-        pass
+        cancel_restore(context)
 
     async def on_key_down(self, ws: websockets.asyncio.client.ClientConnection, context: str, settings: dict[str, Any]) -> None:
         action_name = settings.get("action_name", "")
@@ -48,11 +53,10 @@ class ActionRunHandler:
         try:
             await self.bridge.execute_action(action_name, payload)
             await _set_title(ws, context, "OK!")
-            import asyncio
-            await asyncio.sleep(0.5)
-            await _set_title(ws, context, action_name.split(".")[-1])
+            restore_title_later(ws, context, action_name.split(".")[-1])
         except Exception:
             logger.exception("Failed to execute action %s", action_name)
+            cancel_restore(context)
             await _set_title(ws, context, "Error")
 
     async def on_did_receive_settings(self, ws: websockets.asyncio.client.ClientConnection, context: str, settings: dict[str, Any]) -> None:
@@ -62,13 +66,10 @@ class ActionRunHandler:
         """Handle Property Inspector requests (e.g., fetch action list)."""
         if payload.get("type") == "getActions":
             try:
-                session = await self.bridge._get_session()
-                async with session.get(f"{self.bridge.base_url}/actions") as resp:
-                    resp.raise_for_status()
-                    data = await resp.json()
+                actions = await self.bridge.list_actions()
                 await _send_to_property_inspector(ws, context, {
                     "type": "actionList",
-                    "actions": data.get("actions", []),
+                    "actions": actions,
                 })
             except Exception:
                 logger.exception("Failed to fetch actions for PI")
@@ -27,6 +27,9 @@ _STATUS_EMOJI = {
 class AgentDashboardHandler:
     """Handles com.deckhand.agent.dashboard action instances."""
 
+    # Deckhand event types this handler reacts to
+    DECKHAND_EVENTS = frozenset({"agent.status_changed", "agent.context_changed"})
+
     def __init__(self, bridge: DeckhandBridge) -> None:
         self.bridge = bridge
         # context → last summary
@@ -50,27 +53,36 @@ class AgentDashboardHandler:
 
     async def on_deckhand_event(self, ws: websockets.asyncio.client.ClientConnection, event_type: str, event: dict[str, Any], all_contexts: dict[str, dict[str, Any]]) -> None:
         """Refresh dashboard on any agent status or context change."""
-        if event_type not in ("agent.status_changed", "agent.context_changed"):
+        if event_type not in self.DECKHAND_EVENTS:
+            return
+
+        contexts = list(self._contexts)
+        if not contexts:
             return
 
-        for context in list(self._contexts):
+        # Every dashboard shows the same summary, so fetch the agent list
+        # once per event rather than once per button.
+        title = await self._summary()
+        for context in contexts:
             try:
-                await self._refresh(ws, context)
+                await _set_title(ws, context, title)
             except Exception:
                 logger.exception("Failed to refresh dashboard %s", context)
 
     async def _refresh(self, ws: websockets.asyncio.client.ClientConnection, context: str) -> None:
         """Fetch all agents and display a summary."""
+        await _set_title(ws, context, await self._summary())
+
+    async def _summary(self) -> str:
+        """Fetch all agents and build the dashboard title."""
         try:
             agents = await self.bridge.list_agents()
         except Exception:
             logger.exception("Dashboard: failed to fetch agents")
-            await _set_title(ws, context, "Offline")
-            return
+            return "Offline"
 
         if not agents:
-            await _set_title(ws, context, "No Agents")
-            return
+            return "No Agents"
 
         # Build compact summary: count per status
         counts: dict[str, int] = {}
@@ -85,8 +97,7 @@ class AgentDashboardHandler:
             if count > 0:
                 parts.append(f"{count}{_STATUS_EMOJI.get(status, '')}")
 
-        title = " ".join(parts) if parts else f"{len(agents)} agents"
-        await _set_title(ws, context, title)
+        return " ".join(parts) if parts else f"{len(agents)} agents"
 
 
 async def _set_title(ws: websockets.asyncio.client.ClientConnection, context: str, title: str) -> None:
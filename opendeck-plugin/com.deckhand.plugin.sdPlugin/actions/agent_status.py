@@ -45,10 +45,15 @@ _RETRY_MAX_ATTEMPTS = 3
 class AgentStatusHandler:
     """Handles com.deckhand.agent.status action instances."""
 
+    # Deckhand event types this handler reacts to
+    DECKHAND_EVENTS = frozenset({"agent.status_changed", "agent.context_changed"})
+
     def __init__(self, bridge: DeckhandBridge) -> None:
         self.bridge = bridge
         # context → {"agent_id": str, "sounds_enabled": bool, ...}
         self._watched: dict[str, dict[str, Any]] = {}
+        # agent_id → contexts watching it (reverse index for agent events)
+        self._by_agent_id: dict[str, list[str]] = {}
         # context → asyncio.Task for pending retry
         self._retry_tasks: dict[str, asyncio.Task[None]] = {}
 
@@ -57,13 +62,13 @@ class AgentStatusHandler:
         sounds_enabled = settings.get("sounds_enabled", True)
         auto_retry = settings.get("auto_retry", False)
         retry_max = settings.get("retry_max", _RETRY_MAX_ATTEMPTS)
-        self._watched[context] = {
+        self._watch(context, {
             "agent_id": agent_id,
             "sounds_enabled": sounds_enabled,
             "auto_retry": auto_retry,
             "retry_max": retry_max,
             "retry_count": 0,
-        }
+        })
 
         if not agent_id:
             await _set_title(ws, context, "No Agent")
@@ -86,7 +91,7 @@ class AgentStatusHandler:
             await _set_title(ws, context, "Offline")
 
     async def on_will_disappear(self, context: str) -> None:
-        self._watched.pop(context, None)
+        self._unwatch(context)
         self._cancel_retry(context)
 
     async def on_key_down(self, ws: websockets.asyncio.client.ClientConnection, context: str, settings: dict[str, Any]) -> None:
@@ -138,7 +143,7 @@ class AgentStatusHandler:
 
     async def on_deckhand_event(self, ws: websockets.asyncio.client.ClientConnection, event_type: str, event: dict[str, Any], all_contexts: dict[str, dict[str, Any]]) -> None:
         """Handle events from Deckhand Core."""
-        if event_type not in ("agent.status_changed", "agent.context_changed"):
+        if event_type not in self.DECKHAND_EVENTS:
             return
 
         payload = event.get("payload", {})
@@ -147,12 +152,13 @@ class AgentStatusHandler:
         new_status = agent_data.get("status", "") or payload.get("status", "")
         display_label = agent_data.get("display_label", agent_id)
 
-        for context, info in list(self._watched.items()):
-            if info.get("agent_id") != agent_id:
-                continue
+        state_idx = STATUS_INDEX.get(new_status, 0)
+        title = STATUS_TITLES.get(new_status, "") or display_label
 
-            state_idx = STATUS_INDEX.get(new_status, 0)
-            title = STATUS_TITLES.get(new_status, "") or display_label
+        for context in list(self._by_agent_id.get(agent_id, ())):
+            info = self._watched.get(context)
+            if info is None:
+                continue  # Disappeared while earlier contexts were updating
 
             try:
                 await _set_state(ws, context, state_idx)
@@ -175,6 +181,25 @@ class AgentStatusHandler:
             except Exception:
                 logger.exception("Failed to update context %s", context)
 
+    # ----- Watch bookkeeping -----
+
+    def _watch(self, context: str, info: dict[str, Any]) -> None:
+        """Track a context and index it by its agent id."""
+        self._unwatch(context)
+        self._watched[context] = info
+        self._by_agent_id.setdefault(info["agent_id"], []).append(context)
+
+    def _unwatch(self, context: str) -> None:
+        """Stop tracking a context and drop it from the agent id index."""
+        info = self._watched.pop(context, None)
+        if info is None:
+            return
+        contexts = self._by_agent_id.get(info["agent_id"])
+        if contexts is not None:
+            contexts.remove(context)
+            if not contexts:
+                del self._by_agent_id[info["agent_id"]]
+
     # ----- Auto-retry helpers -----
 
     def _schedule_retry(self, ws: websockets.asyncio.client.ClientConnection, context: str, agent_id: str, info: dict[str, Any]) -> None:
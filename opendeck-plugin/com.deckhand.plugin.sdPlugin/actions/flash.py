@@ -0,0 +1,56 @@
+"""Confirmation-title flash shared by the press-to-run action handlers.
+
+After a press the handler shows a short confirmation ("OK!", "Sent!") and
+calls :func:`restore_title_later` to put the original title back. Any
+other title change on that key calls :func:`cancel_restore` first.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+
+import websockets.asyncio.client
+
+# How long the confirmation title stays up after a press
+FLASH_SECONDS = 0.5
+
+logger = logging.getLogger("deckhand-action-flash")
+
+# Restore task in flight per context; holding it keeps it from being
+# garbage-collected and lets a newer title cancel it
+_pending: dict[str, asyncio.Task[None]] = {}
+
+
+def restore_title_later(ws: websockets.asyncio.client.ClientConnection, context: str, title: str) -> None:
+    """Reset the title once the flash expires, without holding up the key press."""
+    cancel_restore(context)
+    task = asyncio.get_running_loop().create_task(_restore_title(ws, context, title))
+    _pending[context] = task
+    task.add_done_callback(lambda done: _forget(context, done))
+
+
+def cancel_restore(context: str) -> None:
+    """Drop a pending restore so it can't overwrite a newer title."""
+    task = _pending.pop(context, None)
+    if task is not None:
+        task.cancel()
+
+
+def _forget(context: str, task: asyncio.Task[None]) -> None:
+    # A newer restore may already have replaced this one
+    if _pending.get(context) is task:
+        del _pending[context]
+
+
+async def _restore_title(ws: websockets.asyncio.client.ClientConnection, context: str, title: str) -> None:
+    await asyncio.sleep(FLASH_SECONDS)
+    try:
+        await ws.send(json.dumps({
+            "event": "setTitle",
+            "context": context,
+            "payload": {"title": title},
+        }))
+    except Exception:
+        logger.exception("Failed to restore title for %s", context)
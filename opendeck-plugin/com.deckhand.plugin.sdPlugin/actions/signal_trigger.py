@@ -11,6 +11,7 @@ from typing import Any
 
 import websockets.asyncio.client
 
+from actions.flash import cancel_restore, restore_title_later
 from bridge import DeckhandBridge
 
 logger = logging.getLogger("deckhand-action-signal")
@@ -19,10 +20,14 @@ logger = logging.getLogger("deckhand-action-signal")
 class SignalTriggerHandler:
     """Handles com.deckhand.signal.trigger action instances."""
 
+    # Deckhand event types this handler reacts to
+    DECKHAND_EVENTS: frozenset[str] = frozenset()
+
     def __init__(self, bridge: DeckhandBridge) -> None:
         self.bridge = bridge
 
     async def on_will_appear(self, ws: websockets.asyncio.client.ClientConnection, context: str, settings: dict[str, Any]) -> None:
+        cancel_restore(context)
         signal_name = settings.get("signal_name", "")
         if signal_name:
             await _set_title(ws, context, signal_name.split(".")[-1])
@@ -30,7 +35,7 @@ class SignalTriggerHandler:
             await _set_title(ws, context, "No Signal")
 
     async def on_will_disappear(self, context: str) -> None:
-        pass
+        cancel_restore(context)
 
     async def on_key_down(self, ws: websockets.asyncio.client.ClientConnection, context: str, settings: dict[str, Any]) -> None:
         signal_name = settings.get("signal_name", "")
@@ -47,12 +52,10 @@ class SignalTriggerHandler:
         try:
             await self.bridge.send_signal(signal_name, payload)
             await _set_title(ws, context, "Sent!")
-            # Reset title after a short delay
-            import asyncio
-            await asyncio.sleep(0.5)
-            await _set_title(ws, context, signal_name.split(".")[-1])
+            restore_title_later(ws, context, signal_name.split(".")[-1])
         except Exception:
             logger.exception("Failed to send signal %s", signal_name)
+            cancel_restore(context)
             await _set_title(ws, context, "Error")
 
     async def on_did_receive_settings(self, ws: websockets.asyncio.client.ClientConnection, context: str, settings: dict[str, Any]) -> None:
@@ -62,13 +65,10 @@ class SignalTriggerHandler:
         """Handle Property Inspector requests (e.g., fetch signal list)."""
         if payload.get("type") == "getSignals":
             try:
-                session = await self.bridge._get_session()
-                async with session.get(f"{self.bridge.base_url}/signals") as resp:
-                    resp.raise_for_status()
-                    data = await resp.json()
+                signals = await self.bridge.list_signals()
                 await _send_to_property_inspector(ws, context, {
                     "type": "signalList",
-                    "signals": data.get("signals", []),
+                    "signals": signals,
                 })
             except Exception:
                 logger.exception("Failed to fetch signals for PI")
@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import json
 import logging
+from dataclasses import dataclass
 from typing import Any
 
 import websockets.asyncio.client
@@ -17,23 +18,36 @@ from bridge import DeckhandBridge
 logger = logging.getLogger("deckhand-action-widget")
 
 
+@dataclass(frozen=True, slots=True)
+class WidgetBinding:
+    """Settings for a widget context, parsed once when it appears."""
+
+    state_key: str
+    action_on_press: str = ""
+    display_format: str = "raw"
+
+
 class WidgetHandler:
     """Handles com.deckhand.widget action instances."""
 
+    # Deckhand event types this handler reacts to
+    DECKHAND_EVENTS = frozenset({"state.changed"})
+
     def __init__(self, bridge: DeckhandBridge) -> None:
         self.bridge = bridge
-        # context → {"state_key": str, "action_on_press": str, "display_format": str}
-        self._watched: dict[str, dict[str, Any]] = {}
+        # context → parsed widget settings
+        self._watched: dict[str, WidgetBinding] = {}
+        # state_key → contexts watching it (reverse index for state events)
+        self._by_state_key: dict[str, list[str]] = {}
 
     async def on_will_appear(self, ws: websockets.asyncio.client.ClientConnection, context: str, settings: dict[str, Any]) -> None:
-        state_key = settings.get("state_key", "")
-        action_on_press = settings.get("action_on_press", "")
-        display_format = settings.get("display_format", "raw")
-        self._watched[context] = {
-            "state_key": state_key,
-            "action_on_press": action_on_press,
-            "display_format": display_format,
-        }
+        binding = WidgetBinding(
+            state_key=settings.get("state_key", ""),
+            action_on_press=settings.get("action_on_press", ""),
+            display_format=settings.get("display_format", "raw"),
+        )
+        self._watch(context, binding)
+        state_key = binding.state_key
 
         if not state_key:
             await _set_title(ws, context, "No Key")
@@ -44,7 +58,7 @@ class WidgetHandler:
             entry = await self.bridge.get_state(state_key)
             if entry:
                 value = entry.get("value", {})
-                title = _format_value(value, display_format)
+                title = _format_value(value, binding.display_format)
                 await _set_title(ws, context, title)
             else:
                 await _set_title(ws, context, "—")
@@ -53,7 +67,7 @@ class WidgetHandler:
             await _set_title(ws, context, "Offline")
 
     async def on_will_disappear(self, context: str) -> None:
-        self._watched.pop(context, None)
+        self._unwatch(context)
 
     async def on_key_down(self, ws: websockets.asyncio.client.ClientConnection, context: str, settings: dict[str, Any]) -> None:
         action_name = settings.get("action_on_press", "")
@@ -85,25 +99,48 @@ class WidgetHandler:
 
     async def on_deckhand_event(self, ws: websockets.asyncio.client.ClientConnection, event_type: str, event: dict[str, Any], all_contexts: dict[str, dict[str, Any]]) -> None:
         """Handle events from Deckhand Core."""
-        if event_type != "state.changed":
+        if event_type not in self.DECKHAND_EVENTS:
             return
 
         payload = event.get("payload", {})
         changed_key = payload.get("key", "")
+        value = payload.get("value", {})
+        # display_format → title; widgets sharing a format share the work
+        titles: dict[str, str] = {}
 
-        for context, info in list(self._watched.items()):
-            if info.get("state_key") != changed_key:
-                continue
+        for context in list(self._by_state_key.get(changed_key, ())):
+            binding = self._watched.get(context)
+            if binding is None:
+                continue  # Disappeared while earlier contexts were updating
 
-            value = payload.get("value", {})
-            display_format = info.get("display_format", "raw")
-            title = _format_value(value, display_format)
+            title = titles.get(binding.display_format)
+            if title is None:
+                title = titles[binding.display_format] = _format_value(value, binding.display_format)
 
             try:
                 await _set_title(ws, context, title)
             except Exception:
                 logger.exception("Failed to update widget context %s", context)
 
+    # ----- Watch bookkeeping -----
+
+    def _watch(self, context: str, binding: WidgetBinding) -> None:
+        """Track a context and index it by its state key."""
+        self._unwatch(context)
+        self._watched[context] = binding
+        self._by_state_key.setdefault(binding.state_key, []).append(context)
+
+    def _unwatch(self, context: str) -> None:
+        """Stop tracking a context and drop it from the state key index."""
+        binding = self._watched.pop(context, None)
+        if binding is None:
+            return
+        contexts = self._by_state_key.get(binding.state_key)
+        if contexts is not None:
+            contexts.remove(context)
+            if not contexts:
+                del self._by_state_key[binding.state_key]
+
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -5,16 +5,75 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import random
 from typing import Any, Callable
 
 import aiohttp
 
+try:  # orjson is optional; it encodes and parses JSON several times faster
+    import orjson
+
+    _json_loads: Callable[[str | bytes], Any] = orjson.loads
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+
 logger = logging.getLogger("deckhand-bridge")
 
 # Reconnection parameters
 _RECONNECT_BASE_DELAY = 1.0   # seconds
 _RECONNECT_MAX_DELAY = 30.0   # seconds
 _RECONNECT_BACKOFF = 2.0      # multiplier
+_RECONNECT_JITTER = 0.5       # +/- fraction, spreads out mass reconnects
+
+# Protocol-level ping interval; a missed pong drops the connection so the
+# reconnect loop can take over instead of waiting on a half-open socket
+_WS_HEARTBEAT = 20.0  # seconds
+
+# HTTP connection pool: keep sockets alive across button presses
+_HTTP_MAX_CONNECTIONS = 64
+_HTTP_MAX_CONNECTIONS_PER_HOST = 32
+_HTTP_KEEPALIVE_TIMEOUT = 60.0  # seconds
+
+
+def _decode_frame(data: str | bytes) -> list[dict[str, Any]]:
+    """Decode one event-stream frame (text or binary) into its events.
+
+    Core may coalesce a burst of events into a single frame, either as
+    newline-delimited JSON, a JSON array, or a ``{"batch": [...]}`` envelope.
+    A plain event object is returned as a one-element list. Malformed frames
+    and anything that isn't an event object are logged and dropped.
+    """
+    try:
+        decoded = _json_loads(data)
+    except ValueError:
+        # Not a single JSON document; try newline-delimited JSON
+        try:
+            decoded = [_json_loads(line) for line in data.splitlines() if line.strip()]
+        except ValueError:
+            logger.warning("Dropping undecodable event frame (%d bytes)", len(data))
+            return []
+    if isinstance(decoded, dict) and "type" not in decoded and isinstance(decoded.get("batch"), list):
+        decoded = decoded["batch"]
+    if isinstance(decoded, dict):
+        return [decoded]
+    if not isinstance(decoded, list):
+        logger.warning("Dropping event frame of type %s", type(decoded).__name__)
+        return []
+    events = [event for event in decoded if isinstance(event, dict)]
+    if len(events) != len(decoded):
+        logger.warning("Dropped %d non-object entries from event frame", len(decoded) - len(events))
+    return events
+
+
+def _ws_base_url(base_url: str) -> str:
+    """Swap an http(s) scheme for its ws(s) counterpart."""
+    if base_url.startswith("https://"):
+        return "wss://" + base_url.removeprefix("https://")
+    return "ws://" + base_url.removeprefix("http://")
 
 
 class DeckhandBridge:
@@ -22,10 +81,9 @@ class DeckhandBridge:
 
     def __init__(self, base_url: str = "http://localhost:8000", api_key: str | None = None) -> None:
         self.base_url = base_url.rstrip("/")
-        ws_base = self.base_url.replace("http://", "ws://").replace("https://", "wss://")
         # WebSocket URL no longer carries the token as a query param;
         # authentication happens via a first-message handshake instead.
-        self.ws_url = f"{ws_base}/events"
+        self.ws_url = f"{_ws_base_url(self.base_url)}/events"
         self._api_key = api_key
         self._session: aiohttp.ClientSession | None = None
         self.connected = False
@@ -35,7 +93,16 @@ class DeckhandBridge:
             headers: dict[str, str] = {}
             if self._api_key:
                 headers["Authorization"] = f"Bearer {self._api_key}"
-            self._session = aiohttp.ClientSession(headers=headers)
+            connector = aiohttp.TCPConnector(
+                limit=_HTTP_MAX_CONNECTIONS,
+                limit_per_host=_HTTP_MAX_CONNECTIONS_PER_HOST,
+                keepalive_timeout=_HTTP_KEEPALIVE_TIMEOUT,
+            )
+            self._session = aiohttp.ClientSession(
+                headers=headers,
+                connector=connector,
+                json_serialize=_json_dumps,
+            )
         return self._session
 
     async def close(self) -> None:
@@ -48,7 +115,7 @@ class DeckhandBridge:
         session = await self._get_session()
         async with session.get(f"{self.base_url}/agents") as resp:
             resp.raise_for_status()
-            return await resp.json()
+            return await resp.json(loads=_json_loads)
 
     async def start_agent(self, agent_id: str) -> None:
         session = await self._get_session()
@@ -90,7 +157,7 @@ class DeckhandBridge:
             f"{self.base_url}/agents/register", json=body
         ) as resp:
             resp.raise_for_status()
-            return await resp.json()
+            return await resp.json(loads=_json_loads)
 
     async def update_agent_context(
         self,
@@ -108,10 +175,17 @@ class DeckhandBridge:
             f"{self.base_url}/agents/{agent_id}/context", json=body
         ) as resp:
             resp.raise_for_status()
-            return await resp.json()
+            return await resp.json(loads=_json_loads)
 
     # ----- HTTP: Actions -----
 
+    async def list_actions(self) -> list[dict[str, Any]]:
+        session = await self._get_session()
+        async with session.get(f"{self.base_url}/actions") as resp:
+            resp.raise_for_status()
+            data = await resp.json(loads=_json_loads)
+            return data.get("actions", [])
+
     async def execute_action(self, action_name: str, payload: dict[str, Any] | None = None) -> None:
         session = await self._get_session()
         async with session.post(
@@ -122,6 +196,13 @@ class DeckhandBridge:
 
     # ----- HTTP: Signals -----
 
+    async def list_signals(self) -> list[dict[str, Any]]:
+        session = await self._get_session()
+        async with session.get(f"{self.base_url}/signals") as resp:
+            resp.raise_for_status()
+            data = await resp.json(loads=_json_loads)
+            return data.get("signals", [])
+
     async def send_signal(self, signal_name: str, payload: dict[str, Any] | None = None) -> None:
         session = await self._get_session()
         async with session.post(
@@ -138,13 +219,13 @@ class DeckhandBridge:
             if resp.status == 404:
                 return None
             resp.raise_for_status()
-            return await resp.json()
+            return await resp.json(loads=_json_loads)
 
     async def list_state(self) -> list[dict[str, Any]]:
         session = await self._get_session()
         async with session.get(f"{self.base_url}/state") as resp:
             resp.raise_for_status()
-            return await resp.json()
+            return await resp.json(loads=_json_loads)
 
     # ----- WebSocket: Events (first-message auth + reconnection) -----
 
@@ -155,7 +236,7 @@ class DeckhandBridge:
         token: "..."}`` and waits for ``{type: "auth_ok"}``) instead of passing
         the token as a query parameter.
 
-        Uses exponential backoff when the connection drops.
+        Uses jittered exponential backoff when the connection drops.
         Runs indefinitely until cancelled.
         """
         delay = _RECONNECT_BASE_DELAY
@@ -163,7 +244,7 @@ class DeckhandBridge:
         while True:
             try:
                 session = await self._get_session()
-                async with session.ws_connect(self.ws_url) as ws:
+                async with session.ws_connect(self.ws_url, heartbeat=_WS_HEARTBEAT) as ws:
                     # --- first-message auth handshake ---
                     if self._api_key:
                         await ws.send_json({"type": "auth", "token": self._api_key})
@@ -178,14 +259,16 @@ class DeckhandBridge:
                     logger.info("Connected to Deckhand Core event stream")
 
                     async for msg in ws:
-                        if msg.type == aiohttp.WSMsgType.TEXT:
+                        if msg.type in (aiohttp.WSMsgType.TEXT, aiohttp.WSMsgType.BINARY):
                             try:
-                                event = json.loads(msg.data)
+                                events = _decode_frame(msg.data)
+                            except json.JSONDecodeError:
+                                logger.warning("Invalid JSON from Deckhand Core: %s", msg.data)
+                                continue
+                            for event in events:
                                 result = callback(event)
                                 if asyncio.iscoroutine(result):
                                     await result
-                            except json.JSONDecodeError:
-                                logger.warning("Invalid JSON from Deckhand Core: %s", msg.data)
                         elif msg.type in (aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.ERROR):
                             break
 
@@ -193,10 +276,15 @@ class DeckhandBridge:
                 self.connected = False
                 raise
             except Exception:
-                self.connected = False
-                logger.warning(
-                    "Deckhand Core WebSocket disconnected, reconnecting in %.1fs",
-                    delay,
-                )
-                await asyncio.sleep(delay)
-                delay = min(delay * _RECONNECT_BACKOFF, _RECONNECT_MAX_DELAY)
+                logger.debug("Deckhand Core event stream error", exc_info=True)
+
+            # A clean close backs off too, so a restarting Core isn't hit by
+            # every plugin instance reconnecting in lockstep.
+            self.connected = False
+            wait = delay * random.uniform(1 - _RECONNECT_JITTER, 1 + _RECONNECT_JITTER)
+            logger.warning(
+                "Deckhand Core WebSocket disconnected, reconnecting in %.1fs",
+                wait,
+            )
+            await asyncio.sleep(wait)
+            delay = min(delay * _RECONNECT_BACKOFF, _RECONNECT_MAX_DELAY)
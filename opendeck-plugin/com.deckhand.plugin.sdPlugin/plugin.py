@@ -11,7 +11,7 @@ import asyncio
 import json
 import logging
 import os
-import sys
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 import websockets
@@ -39,6 +39,9 @@ contexts: dict[str, dict[str, Any]] = {}
 # Action handlers keyed by action UUID
 ACTION_HANDLERS: dict[str, AgentStatusHandler | WidgetHandler] = {}
 
+# Deckhand event type → handlers that react to it (see build_deckhand_routes)
+DECKHAND_ROUTES: dict[str, list[AgentStatusHandler | WidgetHandler]] = {}
+
 # Diagnostics
 diag = PluginDiagnostics()
 
@@ -62,71 +65,99 @@ async def send_to_opendeck(ws: websockets.asyncio.client.ClientConnection, event
     diag.record_sent()
 
 
+async def _on_will_appear(ws: websockets.asyncio.client.ClientConnection, data: dict[str, Any], bridge: DeckhandBridge, action: str, context: str, settings: dict[str, Any]) -> None:
+    contexts[context] = {"action": action, "settings": settings}
+    diag.active_contexts = len(contexts)
+    handler = ACTION_HANDLERS.get(action)
+    if handler:
+        await handler.on_will_appear(ws, context, settings)
+
+
+async def _on_will_disappear(ws: websockets.asyncio.client.ClientConnection, data: dict[str, Any], bridge: DeckhandBridge, action: str, context: str, settings: dict[str, Any]) -> None:
+    contexts.pop(context, None)
+    diag.active_contexts = len(contexts)
+    handler = ACTION_HANDLERS.get(action)
+    if handler:
+        await handler.on_will_disappear(context)
+
+
+async def _on_key_down(ws: websockets.asyncio.client.ClientConnection, data: dict[str, Any], bridge: DeckhandBridge, action: str, context: str, settings: dict[str, Any]) -> None:
+    handler = ACTION_HANDLERS.get(action)
+    if handler:
+        await handler.on_key_down(ws, context, settings)
+
+
+async def _on_did_receive_settings(ws: websockets.asyncio.client.ClientConnection, data: dict[str, Any], bridge: DeckhandBridge, action: str, context: str, settings: dict[str, Any]) -> None:
+    contexts[context] = {"action": action, "settings": settings}
+    handler = ACTION_HANDLERS.get(action)
+    if handler:
+        await handler.on_did_receive_settings(ws, context, settings)
+
+
+async def _on_send_to_plugin(ws: websockets.asyncio.client.ClientConnection, data: dict[str, Any], bridge: DeckhandBridge, action: str, context: str, settings: dict[str, Any]) -> None:
+    payload = data.get("payload", {})
+    # Handle diagnostics request from any PI
+    if payload.get("type") == "getDiagnostics":
+        diag.deckhand_connected = bridge.connected
+        await ws.send(json.dumps({
+            "event": "sendToPropertyInspector",
+            "context": context,
+            "payload": {"type": "diagnostics", "data": diag.as_dict()},
+        }))
+        return
+
+    handler = ACTION_HANDLERS.get(action)
+    if handler and hasattr(handler, "on_send_to_plugin"):
+        await handler.on_send_to_plugin(ws, context, payload)
+
+
+# OpenDeck event name → dispatcher. Events not listed (e.g. keyUp) are ignored.
+_OPENDECK_DISPATCH: dict[str, Callable[..., Awaitable[None]]] = {
+    "willAppear": _on_will_appear,
+    "willDisappear": _on_will_disappear,
+    "keyDown": _on_key_down,
+    "didReceiveSettings": _on_did_receive_settings,
+    "sendToPlugin": _on_send_to_plugin,
+}
+
+
 async def handle_opendeck_event(ws: websockets.asyncio.client.ClientConnection, data: dict[str, Any], bridge: DeckhandBridge) -> None:
     """Dispatch an incoming OpenDeck event to the appropriate handler."""
     diag.record_opendeck_event()
 
     event = data.get("event", "")
+    dispatch = _OPENDECK_DISPATCH.get(event)
+    if dispatch is None:
+        return
+
     action = data.get("action", "")
     context = data.get("context", "")
     settings = data.get("payload", {}).get("settings", {})
 
     try:
-        if event == "willAppear":
-            contexts[context] = {"action": action, "settings": settings}
-            diag.active_contexts = len(contexts)
-            handler = ACTION_HANDLERS.get(action)
-            if handler:
-                await handler.on_will_appear(ws, context, settings)
-
-        elif event == "willDisappear":
-            contexts.pop(context, None)
-            diag.active_contexts = len(contexts)
-            handler = ACTION_HANDLERS.get(action)
-            if handler:
-                await handler.on_will_disappear(context)
-
-        elif event == "keyDown":
-            handler = ACTION_HANDLERS.get(action)
-            if handler:
-                await handler.on_key_down(ws, context, settings)
-
-        elif event == "keyUp":
-            pass  # No action on key up for now
-
-        elif event == "didReceiveSettings":
-            contexts[context] = {"action": action, "settings": settings}
-            handler = ACTION_HANDLERS.get(action)
-            if handler:
-                await handler.on_did_receive_settings(ws, context, settings)
-
-        elif event == "sendToPlugin":
-            payload = data.get("payload", {})
-            # Handle diagnostics request from any PI
-            if payload.get("type") == "getDiagnostics":
-                diag.deckhand_connected = bridge.connected
-                await ws.send(json.dumps({
-                    "event": "sendToPropertyInspector",
-                    "context": context,
-                    "payload": {"type": "diagnostics", "data": diag.as_dict()},
-                }))
-                return
-
-            handler = ACTION_HANDLERS.get(action)
-            if handler and hasattr(handler, "on_send_to_plugin"):
-                await handler.on_send_to_plugin(ws, context, payload)
-
+        await dispatch(ws, data, bridge, action, context, settings)
     except Exception as exc:
         diag.record_error(str(exc))
         logger.exception("Error handling OpenDeck event %s", event)
 
 
+def build_deckhand_routes() -> None:
+    """Index ACTION_HANDLERS by the Deckhand event types they react to."""
+    DECKHAND_ROUTES.clear()
+    for handler in ACTION_HANDLERS.values():
+        for event_type in handler.DECKHAND_EVENTS:
+            DECKHAND_ROUTES.setdefault(event_type, []).append(handler)
+
+
 async def handle_deckhand_event(ws: websockets.asyncio.client.ClientConnection, event: dict[str, Any]) -> None:
     """Forward a Deckhand Core event to all relevant OpenDeck contexts."""
     diag.record_deckhand_event()
     event_type = event.get("type", "")
+    if not isinstance(event_type, str):
+        logger.warning("Ignoring Deckhand event with non-string type: %r", event_type)
+        return
 
-    for handler in ACTION_HANDLERS.values():
+    for handler in DECKHAND_ROUTES.get(event_type, ()):
         try:
             await handler.on_deckhand_event(ws, event_type, event, contexts)
         except Exception as exc:
@@ -156,7 +187,8 @@ async def main() -> None:
     info = json.loads(args.info) if args.info else {}
     logger.info("Starting Deckhand plugin (port=%d, uuid=%s)", args.port, args.pluginUUID)
     logger.info("Deckhand Core URL: %s", core_url)
-    logger.info("OpenDeck info: %s", json.dumps(info, indent=2))
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("OpenDeck info: %s", json.dumps(info, indent=2))
 
     # Initialize action handlers
     ACTION_HANDLERS["com.deckhand.agent.status"] = AgentStatusHandler(bridge)
@@ -164,6 +196,7 @@ async def main() -> None:
     ACTION_HANDLERS["com.deckhand.signal.trigger"] = SignalTriggerHandler(bridge)
     ACTION_HANDLERS["com.deckhand.action.run"] = ActionRunHandler(bridge)
     ACTION_HANDLERS["com.deckhand.agent.dashboard"] = AgentDashboardHandler(bridge)
+    build_deckhand_routes()
 
     uri = f"ws://127.0.0.1:{args.port}"
     async with websockets.asyncio.client.connect(uri) as ws:
@@ -193,6 +226,12 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
+    try:  # uvloop is optional; it cuts per-wakeup overhead on the event loop
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        pass
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
@@ -18,9 +18,11 @@ import pytest
 PLUGIN_DIR = Path(__file__).parent.parent / "com.deckhand.plugin.sdPlugin"
 sys.path.insert(0, str(PLUGIN_DIR))
 
+from actions.agent_dashboard import AgentDashboardHandler
+from actions import flash
 from actions.agent_status import AgentStatusHandler, STATUS_INDEX
-from actions.widget import WidgetHandler, _format_value
-from bridge import DeckhandBridge
+from actions.widget import WidgetBinding, WidgetHandler, _format_value
+from bridge import DeckhandBridge, _decode_frame
 
 
 # ---------------------------------------------------------------------------
@@ -102,6 +104,7 @@ class TestAgentStatusHandler:
 
         await agent_handler.on_will_disappear("ctx-1")
         assert "ctx-1" not in agent_handler._watched
+        assert "mock-1" not in agent_handler._by_agent_id
 
     async def test_key_down_starts_idle_agent(self, agent_handler, mock_ws, mock_bridge):
         """Pressing a button for an idle agent should start it."""
@@ -130,7 +133,7 @@ class TestAgentStatusHandler:
     async def test_deckhand_event_updates_context(self, agent_handler, mock_ws):
         """agent.status_changed event should update watched contexts."""
         # Register a context watching mock-1
-        agent_handler._watched["ctx-1"] = {"agent_id": "mock-1", "sounds_enabled": False}
+        agent_handler._watch("ctx-1", {"agent_id": "mock-1", "sounds_enabled": False})
 
         event = {
             "type": "agent.status_changed",
@@ -144,7 +147,7 @@ class TestAgentStatusHandler:
 
     async def test_deckhand_event_ignores_unwatched_agent(self, agent_handler, mock_ws):
         """Events for unwatched agents should be ignored."""
-        agent_handler._watched["ctx-1"] = {"agent_id": "mock-1", "sounds_enabled": False}
+        agent_handler._watch("ctx-1", {"agent_id": "mock-1", "sounds_enabled": False})
 
         event = {
             "type": "agent.status_changed",
@@ -209,10 +212,7 @@ class TestWidgetHandler:
 
     async def test_deckhand_event_updates_widget(self, widget_handler, mock_ws):
         """state.changed event should update watched widget title."""
-        widget_handler._watched["ctx-w1"] = {
-            "state_key": "test.key",
-            "display_format": "raw",
-        }
+        widget_handler._watch("ctx-w1", WidgetBinding(state_key="test.key"))
 
         event = {
             "type": "state.changed",
@@ -224,12 +224,34 @@ class TestWidgetHandler:
         title_calls = [c for c in calls if c["event"] == "setTitle"]
         assert title_calls[0]["payload"]["title"] == "99"
 
+    async def test_will_disappear_drops_index(self, widget_handler, mock_ws):
+        """willDisappear should remove the context from the state key index."""
+        await widget_handler.on_will_appear(mock_ws, "ctx-w1", {"state_key": "test.key"})
+        await widget_handler.on_will_appear(mock_ws, "ctx-w2", {"state_key": "test.key"})
+        assert widget_handler._by_state_key["test.key"] == ["ctx-w1", "ctx-w2"]
+
+        await widget_handler.on_will_disappear("ctx-w1")
+        assert widget_handler._by_state_key["test.key"] == ["ctx-w2"]
+        await widget_handler.on_will_disappear("ctx-w2")
+        assert "test.key" not in widget_handler._by_state_key
+
+    async def test_deckhand_event_formats_once_per_display_format(self, widget_handler, mock_ws):
+        """Widgets sharing a display format should reuse one formatted title."""
+        widget_handler._watch("ctx-w1", WidgetBinding(state_key="test.key"))
+        widget_handler._watch("ctx-w2", WidgetBinding(state_key="test.key"))
+        widget_handler._watch("ctx-w3", WidgetBinding(state_key="test.key", display_format="percentage"))
+
+        event = {"type": "state.changed", "payload": {"key": "test.key", "value": 42}}
+        with patch("actions.widget._format_value", side_effect=_format_value) as fmt:
+            await widget_handler.on_deckhand_event(mock_ws, "state.changed", event, {})
+
+        assert fmt.call_count == 2
+        titles = [json.loads(c.args[0])["payload"]["title"] for c in mock_ws.send.call_args_list]
+        assert titles == ["42", "42", "42%"]
+
     async def test_deckhand_event_ignores_other_keys(self, widget_handler, mock_ws):
         """state.changed for a different key should be ignored."""
-        widget_handler._watched["ctx-w1"] = {
-            "state_key": "test.key",
-            "display_format": "raw",
-        }
+        widget_handler._watch("ctx-w1", WidgetBinding(state_key="test.key"))
 
         event = {
             "type": "state.changed",
@@ -239,6 +261,23 @@ class TestWidgetHandler:
         mock_ws.send.assert_not_called()
 
 
+# ---------------------------------------------------------------------------
+# AgentDashboardHandler tests
+# ---------------------------------------------------------------------------
+
+class TestAgentDashboardHandler:
+    async def test_event_fetches_agents_once(self, mock_ws, mock_bridge):
+        """All dashboards should share one agent list fetch per event."""
+        handler = AgentDashboardHandler(mock_bridge)
+        handler._contexts = {"ctx-a": {}, "ctx-b": {}, "ctx-c": {}}
+
+        await handler.on_deckhand_event(mock_ws, "agent.status_changed", {}, {})
+
+        mock_bridge.list_agents.assert_awaited_once()
+        titles = [json.loads(c.args[0])["payload"]["title"] for c in mock_ws.send.call_args_list]
+        assert titles == ["1> 1-"] * 3
+
+
 # ---------------------------------------------------------------------------
 # _format_value tests
 # ---------------------------------------------------------------------------
@@ -263,3 +302,181 @@ class TestFormatValue:
     def test_long_string_truncated(self):
         result = _format_value("a" * 50, "raw")
         assert len(result) <= 12
+
+
+# ---------------------------------------------------------------------------
+# Title flash tests
+# ---------------------------------------------------------------------------
+
+class TestRestoreTitleLater:
+    async def test_title_restored_after_flash(self, mock_ws, monkeypatch):
+        monkeypatch.setattr(flash, "FLASH_SECONDS", 0)
+        flash.restore_title_later(mock_ws, "ctx1", "start")
+        assert len(flash._pending) == 1  # Held until it finishes
+
+        await asyncio.sleep(0.01)
+        assert not flash._pending
+        sent = json.loads(mock_ws.send.call_args[0][0])
+        assert sent == {"event": "setTitle", "context": "ctx1", "payload": {"title": "start"}}
+
+    async def test_newer_restore_replaces_pending_one(self, mock_ws, monkeypatch):
+        monkeypatch.setattr(flash, "FLASH_SECONDS", 0.01)
+        flash.restore_title_later(mock_ws, "ctx1", "old")
+        flash.restore_title_later(mock_ws, "ctx1", "new")
+        assert len(flash._pending) == 1
+
+        await asyncio.sleep(0.05)
+        assert not flash._pending
+        mock_ws.send.assert_awaited_once()
+        assert json.loads(mock_ws.send.call_args[0][0])["payload"] == {"title": "new"}
+
+    async def test_cancel_restore_keeps_newer_title(self, mock_ws, monkeypatch):
+        monkeypatch.setattr(flash, "FLASH_SECONDS", 0.01)
+        flash.restore_title_later(mock_ws, "ctx1", "start")
+        flash.cancel_restore("ctx1")
+
+        await asyncio.sleep(0.05)
+        assert not flash._pending
+        mock_ws.send.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# DeckhandBridge tests
+# ---------------------------------------------------------------------------
+
+class TestBridgeUrls:
+    def test_ws_url_from_http(self):
+        assert DeckhandBridge("http://localhost:8000/").ws_url == "ws://localhost:8000/events"
+
+    def test_ws_url_from_https(self):
+        assert DeckhandBridge("https://deck.example").ws_url == "wss://deck.example/events"
+
+
+# ---------------------------------------------------------------------------
+# Event frame decoding tests
+# ---------------------------------------------------------------------------
+
+class TestDecodeFrame:
+    EVENTS = [{"type": "a", "payload": {}}, {"type": "b", "payload": {}}]
+
+    def test_single_event(self):
+        assert _decode_frame(json.dumps(self.EVENTS[0])) == self.EVENTS[:1]
+
+    def test_json_array(self):
+        assert _decode_frame(json.dumps(self.EVENTS)) == self.EVENTS
+
+    def test_batch_envelope(self):
+        assert _decode_frame(json.dumps({"batch": self.EVENTS})) == self.EVENTS
+
+    def test_newline_delimited(self):
+        frame = "\n".join(json.dumps(e) for e in self.EVENTS) + "\n"
+        assert _decode_frame(frame) == self.EVENTS
+
+    def test_binary_frames(self):
+        assert _decode_frame(json.dumps(self.EVENTS).encode()) == self.EVENTS
+        frame = "\n".join(json.dumps(e) for e in self.EVENTS).encode()
+        assert _decode_frame(frame) == self.EVENTS
+
+    def test_pretty_printed_frame_not_split(self):
+        assert _decode_frame(json.dumps(self.EVENTS, indent=2)) == self.EVENTS
+        event = {"type": "a", "payload": {"text": "line one\nline two"}}
+        assert _decode_frame(json.dumps(event, indent=2)) == [event]
+
+    def test_non_event_frames_dropped(self):
+        assert _decode_frame('"hello"') == []
+        assert _decode_frame("42") == []
+        assert _decode_frame("{not json\nat all}") == []
+        assert _decode_frame(json.dumps([self.EVENTS[0], 1, "x"])) == self.EVENTS[:1]
+
+
+# ---------------------------------------------------------------------------
+# Key press ordering tests
+# ---------------------------------------------------------------------------
+
+class TestKeyDownOrdering:
+    async def test_key_down_sees_preceding_settings(self, mock_ws, mock_bridge):
+        """keyDown is handled inline, after a didReceiveSettings that arrived first."""
+        import plugin
+
+        seen: list[dict] = []
+
+        class RecordingHandler:
+            async def on_did_receive_settings(self, ws, context, settings):
+                pass
+
+            async def on_key_down(self, ws, context, settings):
+                seen.append(plugin.contexts[context]["settings"])
+
+        with patch.dict(plugin.ACTION_HANDLERS, {"com.test.rec": RecordingHandler()}), \
+                patch.dict(plugin.contexts, clear=True):
+            await plugin.handle_opendeck_event(mock_ws, {
+                "event": "didReceiveSettings",
+                "action": "com.test.rec",
+                "context": "ctx-k",
+                "payload": {"settings": {"v": 2}},
+            }, mock_bridge)
+            await plugin.handle_opendeck_event(mock_ws, {
+                "event": "keyDown",
+                "action": "com.test.rec",
+                "context": "ctx-k",
+                "payload": {"settings": {"v": 2}},
+            }, mock_bridge)
+
+        assert seen == [{"v": 2}]
+
+
+# ---------------------------------------------------------------------------
+# OpenDeck event dispatch tests
+# ---------------------------------------------------------------------------
+
+class TestOpenDeckDispatch:
+    async def test_will_appear_routes_to_handler(self, mock_ws, mock_bridge, widget_handler):
+        """willAppear should register the context and reach the action handler."""
+        import plugin
+
+        data = {
+            "event": "willAppear",
+            "action": "com.deckhand.widget",
+            "context": "ctx-d1",
+            "payload": {"settings": {"state_key": "test.key"}},
+        }
+        with patch.dict(plugin.ACTION_HANDLERS, {"com.deckhand.widget": widget_handler}), \
+                patch.dict(plugin.contexts, clear=True):
+            await plugin.handle_opendeck_event(mock_ws, data, mock_bridge)
+            assert plugin.contexts["ctx-d1"]["action"] == "com.deckhand.widget"
+        mock_bridge.get_state.assert_awaited_once_with("test.key")
+
+    async def test_deckhand_event_routed_by_type(self, mock_ws, agent_handler, widget_handler):
+        """Deckhand events should only reach handlers that declare their type."""
+        import plugin
+
+        agent_handler.on_deckhand_event = AsyncMock()
+        widget_handler.on_deckhand_event = AsyncMock()
+        handlers = {"com.deckhand.agent.status": agent_handler, "com.deckhand.widget": widget_handler}
+        with patch.dict(plugin.ACTION_HANDLERS, handlers, clear=True), \
+                patch.dict(plugin.DECKHAND_ROUTES, clear=True):
+            plugin.build_deckhand_routes()
+            await plugin.handle_deckhand_event(mock_ws, {"type": "state.changed", "payload": {}})
+            await plugin.handle_deckhand_event(mock_ws, {"type": "action.executed", "payload": {}})
+
+        widget_handler.on_deckhand_event.assert_awaited_once()
+        agent_handler.on_deckhand_event.assert_not_called()
+
+    async def test_deckhand_event_with_non_string_type_ignored(self, mock_ws, widget_handler):
+        """A malformed event type is dropped instead of raising into the listener."""
+        import plugin
+
+        widget_handler.on_deckhand_event = AsyncMock()
+        with patch.dict(plugin.ACTION_HANDLERS, {"com.deckhand.widget": widget_handler}, clear=True), \
+                patch.dict(plugin.DECKHAND_ROUTES, clear=True):
+            plugin.build_deckhand_routes()
+            await plugin.handle_deckhand_event(mock_ws, {"type": ["state.changed"], "payload": {}})
+
+        widget_handler.on_deckhand_event.assert_not_called()
+
+    async def test_unknown_event_ignored(self, mock_ws, mock_bridge):
+        """Events without a dispatcher (e.g. keyUp) are dropped."""
+        import plugin
+
+        await plugin.handle_opendeck_event(mock_ws, {"event": "keyUp"}, mock_bridge)
+        mock_ws.send.assert_not_called()
@@ -28,6 +28,7 @@ class AgentBase(ABC):
         project_root: Optional[str] = None,
         active_file: Optional[str] = None,
     ) -> None:
+        self._dict_cache: Optional[dict[str, object]] = None
         self.id = agent_id
         self.type = agent_type
         self.status = AgentStatus.IDLE
@@ -36,6 +37,35 @@ class AgentBase(ABC):
         self.active_file = active_file
         self.on_event: Optional[EventHandler] = None
 
+    # Fields that appear in as_dict() drop the cached snapshot when changed.
+
+    @property
+    def status(self) -> AgentStatus:
+        return self._status
+
+    @status.setter
+    def status(self, value: AgentStatus) -> None:
+        self._status = value
+        self._dict_cache = None
+
+    @property
+    def project_root(self) -> Optional[str]:
+        return self._project_root
+
+    @project_root.setter
+    def project_root(self, value: Optional[str]) -> None:
+        self._project_root = value
+        self._dict_cache = None
+
+    @property
+    def active_file(self) -> Optional[str]:
+        return self._active_file
+
+    @active_file.setter
+    def active_file(self, value: Optional[str]) -> None:
+        self._active_file = value
+        self._dict_cache = None
+
     @property
     def display_label(self) -> str:
         """Context-aware label for UI display.
@@ -50,16 +80,23 @@ class AgentBase(ABC):
         return f"{self.type}: {project_name}"
 
     def as_dict(self) -> dict[str, object]:
-        d: dict[str, object] = {
-            "id": self.id,
-            "type": self.type,
-            "status": self.status.value,
-            "capabilities": self.capabilities,
-            "project_root": self.project_root,
-            "active_file": self.active_file,
-            "display_label": self.display_label,
-        }
-        return d
+        """Snapshot of the agent for API responses and event payloads.
+
+        The snapshot is built once and reused until status or project
+        context changes; each call returns a shallow copy with the
+        capabilities frozen as a tuple, so callers can't mutate the cache.
+        """
+        if self._dict_cache is None:
+            self._dict_cache = {
+                "id": self.id,
+                "type": self.type,
+                "status": self.status.value,
+                "capabilities": tuple(self.capabilities),
+                "project_root": self.project_root,
+                "active_file": self.active_file,
+                "display_label": self.display_label,
+            }
+        return dict(self._dict_cache)
 
     async def _set_status(self, status: AgentStatus) -> None:
         self.status = status
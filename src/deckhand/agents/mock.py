@@ -8,13 +8,18 @@ from deckhand.orchestrator.events import build_event
 
 
 class MockAgent(AgentBase):
-    """Simulates a simple lifecycle with input gating."""
+    """Simulates a simple lifecycle with input gating.
+
+    ``work_delay`` is how long each simulated work phase takes, in seconds;
+    tests can pass 0 to run the lifecycle without wall-clock waits.
+    """
 
     def __init__(
         self,
         agent_id: str,
         project_root: Optional[str] = None,
         active_file: Optional[str] = None,
+        work_delay: float = 0.5,
     ) -> None:
         super().__init__(
             agent_id=agent_id,
@@ -26,11 +31,12 @@ class MockAgent(AgentBase):
         self._task: Optional[asyncio.Task[None]] = None
         self._input_event = asyncio.Event()
         self._input_value: Optional[str] = None
+        self._work_delay = work_delay
 
     async def start(self) -> None:
         if self._task is not None and not self._task.done():
             return
-        self._input_event = asyncio.Event()
+        self._input_event.clear()
         self._input_value = None
         self._task = asyncio.create_task(self._run())
 
@@ -64,11 +70,11 @@ class MockAgent(AgentBase):
     async def _run(self) -> None:
         try:
             await self._set_status(AgentStatus.RUNNING)
-            await asyncio.sleep(0.5)
+            await asyncio.sleep(self._work_delay)
             await self._set_status(AgentStatus.AWAITING_INPUT)
             await self._input_event.wait()
             await self._set_status(AgentStatus.RUNNING)
-            await asyncio.sleep(0.5)
+            await asyncio.sleep(self._work_delay)
             await self._set_status(AgentStatus.IDLE)
             await self._emit_event(
                 build_event(
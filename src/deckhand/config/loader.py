@@ -6,11 +6,17 @@ import tomllib
 from pathlib import Path
 from typing import Any
 
+# path → (mtime_ns, size, parsed config); reparsed only when the file changes
+_config_cache: dict[str, tuple[int, int, dict[str, Any]]] = {}
+
 
 def load_config(file_path: str | Path | None) -> dict[str, Any]:
     """
     Load configuration from TOML file.
 
+    Parsed files are cached by modification time and size, so repeated loads
+    of an unchanged file are free. Treat the returned dict as read-only.
+
     Args:
         file_path: Path to TOML config file, or None to return empty dict
 
@@ -21,11 +27,21 @@ def load_config(file_path: str | Path | None) -> dict[str, Any]:
         return {}
 
     path = Path(file_path)
-    if not path.exists():
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
         return {}
 
+    cache_key = str(path.resolve())
+    cached = _config_cache.get(cache_key)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+
     try:
         with open(path, "rb") as f:
-            return tomllib.load(f)
+            config = tomllib.load(f)
     except Exception as e:
         raise ValueError(f"Failed to load config file {file_path}: {e}") from e
+
+    _config_cache[cache_key] = (stat.st_mtime_ns, stat.st_size, config)
+    return config
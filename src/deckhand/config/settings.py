@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import logging
 import os
+from collections.abc import Mapping
 from typing import Any
 
 from deckhand.config.loader import load_config
@@ -56,14 +57,18 @@ class Settings:
         self.config_file_path: str | None = None
         self.state_file_path: str | None = None
         self.rate_limit_rpm: int = 60
+        self.event_batch_ms: int = 0  # 0 = send every event immediately
         self.log_level: str = "INFO"
         self.log_format: str = "plain"  # "plain" or "json"
 
         # Auth: list of {key, scope} dicts
         self._raw_api_keys: list[dict[str, str]] = []
 
+        # Every environment lookup below goes through this one mapping
+        env = os.environ
+
         # Load from config file: explicit env var, or auto-discover ./config.toml
-        config_file = os.getenv("DECKHAND_CONFIG_FILE")
+        config_file = env.get("DECKHAND_CONFIG_FILE")
         if not config_file and os.path.exists("config.toml"):
             config_file = "config.toml"
         if config_file:
@@ -71,7 +76,7 @@ class Settings:
             self._load_from_config_file(config_file)
 
         # Environment variables override config file
-        self._load_from_env()
+        self._load_from_env(env)
 
         # Auto-generate a write key if none configured
         self._generated_key: str | None = None
@@ -100,38 +105,37 @@ class Settings:
         config = load_config(file_path)
 
         # Service settings
-        if "service" in config:
-            service_config = config["service"]
+        if service_config := config.get("service"):
             self.service_name = service_config.get("name", self.service_name)
             self.host = service_config.get("host", self.host)
             self.port = service_config.get("port", self.port)
 
         # Plugin settings
-        if "plugins" in config:
-            plugin_config = config["plugins"]
-            modules = plugin_config.get("modules")
-            if modules:
-                self.plugin_specs = [_parse_plugin_entry(m) for m in modules]
+        if (plugin_config := config.get("plugins")) and (
+            modules := plugin_config.get("modules")
+        ):
+            self.plugin_specs = [_parse_plugin_entry(m) for m in modules]
 
         # Path settings
-        if "paths" in config:
-            paths_config = config["paths"]
-            if state_file := paths_config.get("state_file"):
-                self.state_file_path = state_file
+        if (paths_config := config.get("paths")) and (
+            state_file := paths_config.get("state_file")
+        ):
+            self.state_file_path = state_file
 
         # Auth settings
-        if "auth" in config:
-            auth_config = config["auth"]
+        if auth_config := config.get("auth"):
             self._load_auth(auth_config)
 
         # Rate limiting
-        if "rate_limit" in config:
-            rl_config = config["rate_limit"]
+        if rl_config := config.get("rate_limit"):
             self.rate_limit_rpm = rl_config.get("rpm", self.rate_limit_rpm)
 
+        # Event stream
+        if events_config := config.get("events"):
+            self.event_batch_ms = events_config.get("batch_ms", self.event_batch_ms)
+
         # Logging
-        if "logging" in config:
-            log_config = config["logging"]
+        if log_config := config.get("logging"):
             self.log_level = log_config.get("level", self.log_level)
             self.log_format = log_config.get("format", self.log_format)
 
@@ -144,42 +148,49 @@ class Settings:
     # Environment variable overrides
     # ------------------------------------------------------------------
 
-    def _load_from_env(self) -> None:
-        """Load settings from environment variables (highest priority)."""
-        if host := os.getenv("DECKHAND_HOST"):
+    def _load_from_env(self, env: Mapping[str, str]) -> None:
+        """Load settings from environment variables (highest priority).
+
+        ``DECKHAND_CONFIG_FILE`` is handled in ``__init__``, since it decides
+        which config file is loaded before these overrides apply.
+        """
+        if host := env.get("DECKHAND_HOST"):
             self.host = host
 
-        if port_str := os.getenv("DECKHAND_PORT"):
+        if port_str := env.get("DECKHAND_PORT"):
             try:
                 self.port = int(port_str)
             except ValueError:
                 pass
 
-        if config_file := os.getenv("DECKHAND_CONFIG_FILE"):
-            self.config_file_path = config_file
-
-        if plugins_str := os.getenv("DECKHAND_PLUGINS"):
+        if plugins_str := env.get("DECKHAND_PLUGINS"):
             self.plugin_specs = [
                 _parse_plugin_entry(p.strip())
                 for p in plugins_str.split(",")
                 if p.strip()
             ]
 
-        if state_file := os.getenv("DECKHAND_STATE_FILE"):
+        if state_file := env.get("DECKHAND_STATE_FILE"):
             self.state_file_path = state_file
 
         # DECKHAND_API_KEY env var → write-scoped key (overrides config file)
-        if api_key := os.getenv("DECKHAND_API_KEY"):
+        if api_key := env.get("DECKHAND_API_KEY"):
             self._raw_api_keys = [{"key": api_key, "scope": "write"}]
 
-        if rpm_str := os.getenv("DECKHAND_RATE_LIMIT_RPM"):
+        if rpm_str := env.get("DECKHAND_RATE_LIMIT_RPM"):
             try:
                 self.rate_limit_rpm = int(rpm_str)
             except ValueError:
                 pass
 
-        if log_level := os.getenv("DECKHAND_LOG_LEVEL"):
+        if batch_str := env.get("DECKHAND_EVENT_BATCH_MS"):
+            try:
+                self.event_batch_ms = int(batch_str)
+            except ValueError:
+                pass
+
+        if log_level := env.get("DECKHAND_LOG_LEVEL"):
             self.log_level = log_level
 
-        if log_format := os.getenv("DECKHAND_LOG_FORMAT"):
+        if log_format := env.get("DECKHAND_LOG_FORMAT"):
             self.log_format = log_format
@@ -13,7 +13,6 @@ from fastapi import (
     HTTPException,
     Request,
     WebSocket,
-    WebSocketDisconnect,
 )
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
@@ -35,7 +34,6 @@ from deckhand.security import (
     RateLimiter,
     has_scope,
     resolve_key,
-    validate_payload,
 )
 
 logger = logging.getLogger(__name__)
@@ -52,6 +50,13 @@ _service_start_time: float | None = None
 
 SERVICE_VERSION = "0.3.0"
 
+# Source attribution for API error events, shared across requests
+_AGENTS_START_SOURCE = {"kind": "api", "id": "agents.start"}
+_AGENTS_CANCEL_SOURCE = {"kind": "api", "id": "agents.cancel"}
+_AGENTS_INPUT_SOURCE = {"kind": "api", "id": "agents.input"}
+_ACTIONS_RUN_SOURCE = {"kind": "api", "id": "actions.run"}
+_SIGNALS_WEBHOOK_SOURCE = {"kind": "api", "id": "signals.webhook"}
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -76,13 +81,13 @@ async def lifespan(app: FastAPI):
 
     # Log configuration
     logger.info("Configuration:")
-    logger.info(f"  Host: {settings.host}")
-    logger.info(f"  Port: {settings.port}")
-    logger.info(f"  Config file: {settings.config_file_path or 'none'}")
-    logger.info(f"  State file: {settings.state_file_path or 'none (in-memory only)'}")
-    logger.info(f"  API keys: {len(settings.api_keys)} configured")
-    logger.info(f"  Rate limit: {settings.rate_limit_rpm} req/min")
-    logger.info(f"  Plugins: {', '.join(settings.plugin_modules)}")
+    logger.info("  Host: %s", settings.host)
+    logger.info("  Port: %s", settings.port)
+    logger.info("  Config file: %s", settings.config_file_path or "none")
+    logger.info("  State file: %s", settings.state_file_path or "none (in-memory only)")
+    logger.info("  API keys: %d configured", len(settings.api_keys))
+    logger.info("  Rate limit: %s req/min", settings.rate_limit_rpm)
+    logger.info("  Plugins: %s", ", ".join(settings.plugin_modules))
 
     if settings._generated_key:
         logger.warning(
@@ -100,6 +105,7 @@ async def lifespan(app: FastAPI):
     orchestrator = Orchestrator(
         state_persist_path=settings.state_file_path,
         metrics=metrics,
+        event_batch_window=settings.event_batch_ms / 1000,
     )
     orchestrator.register_agent(
         MockAgent(agent_id="mock-1", project_root="/home/dev/project-alpha")
@@ -131,6 +137,8 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info("Shutting down Deckhand service...")
+    # Deliver events still held in the batch window
+    await orchestrator.event_bus.flush()
 
 
 app = FastAPI(title="Deckhand", version=SERVICE_VERSION, lifespan=lifespan)
@@ -363,7 +371,7 @@ async def start_agent(agent_id: str) -> dict[str, str]:
             build_error_event(
                 "NotFoundError",
                 f"Agent not found: {agent_id}",
-                {"kind": "api", "id": "agents.start"},
+                _AGENTS_START_SOURCE,
                 {"agent_id": agent_id},
             )
         )
@@ -382,7 +390,7 @@ async def cancel_agent(agent_id: str) -> dict[str, str]:
             build_error_event(
                 "NotFoundError",
                 f"Agent not found: {agent_id}",
-                {"kind": "api", "id": "agents.cancel"},
+                _AGENTS_CANCEL_SOURCE,
                 {"agent_id": agent_id},
             )
         )
@@ -401,7 +409,7 @@ async def provide_input(agent_id: str, payload: InputPayload) -> dict[str, str]:
             build_error_event(
                 "NotFoundError",
                 f"Agent not found: {agent_id}",
-                {"kind": "api", "id": "agents.input"},
+                _AGENTS_INPUT_SOURCE,
                 {"agent_id": agent_id},
             )
         )
@@ -490,19 +498,19 @@ async def run_action(
             build_error_event(
                 "NotFoundError",
                 f"Action not found: {action_name}",
-                {"kind": "api", "id": "actions.run"},
+                _ACTIONS_RUN_SOURCE,
                 {"action_name": action_name},
             )
         )
         raise HTTPException(status_code=404, detail="action not found")
 
-    errors = validate_payload(payload, metadata.payload_schema)
+    errors = action_registry.validate_payload(action_name, payload)
     if errors:
         await orchestrator.event_bus.emit(
             build_error_event(
                 "ValidationError",
                 f"Payload validation failed for action '{action_name}'",
-                {"kind": "api", "id": "actions.run"},
+                _ACTIONS_RUN_SOURCE,
                 {"action_name": action_name, "errors": errors},
             )
         )
@@ -515,7 +523,7 @@ async def run_action(
             build_error_event(
                 "ValidationError",
                 str(exc),
-                {"kind": "api", "id": "actions.run"},
+                _ACTIONS_RUN_SOURCE,
                 {"action_name": action_name, "payload": payload},
             )
         )
@@ -574,19 +582,19 @@ async def handle_webhook_signal(
             build_error_event(
                 "NotFoundError",
                 f"Signal not found: {signal_name}",
-                {"kind": "api", "id": "signals.webhook"},
+                _SIGNALS_WEBHOOK_SOURCE,
                 {"signal_name": signal_name},
             )
         )
         raise HTTPException(status_code=404, detail="signal not found")
 
-    errors = validate_payload(payload, metadata.payload_schema)
+    errors = signal_registry.validate_payload(signal_name, payload)
     if errors:
         await orchestrator.event_bus.emit(
             build_error_event(
                 "ValidationError",
                 f"Payload validation failed for signal '{signal_name}'",
-                {"kind": "api", "id": "signals.webhook"},
+                _SIGNALS_WEBHOOK_SOURCE,
                 {"signal_name": signal_name, "errors": errors},
             )
         )
@@ -599,7 +607,7 @@ async def handle_webhook_signal(
             build_error_event(
                 "ValidationError",
                 str(exc),
-                {"kind": "api", "id": "signals.webhook"},
+                _SIGNALS_WEBHOOK_SOURCE,
                 {"signal_name": signal_name, "payload": payload},
             )
         )
@@ -716,7 +724,9 @@ async def events(websocket: WebSocket) -> None:
     # Authenticated — subscribe to event stream (already accepted, skip accept)
     await orchestrator.event_bus.subscribe(websocket, accept=False)
     try:
-        while True:
-            await websocket.receive_text()
-    except WebSocketDisconnect:
+        # Client frames are ignored; read raw ASGI messages (no decoding) only
+        # to notice the disconnect
+        while (await websocket.receive())["type"] != "websocket.disconnect":
+            pass
+    finally:
         orchestrator.event_bus.unsubscribe(websocket)
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import sys
 from typing import Any, Awaitable, Callable, Protocol
 
 from deckhand.metrics import Metrics
 from deckhand.orchestrator.metadata import ActionMetadata
+from deckhand.security import PayloadValidator, compile_payload_validator
 
 
 class OrchestratorActions(Protocol):
@@ -29,6 +31,8 @@ class ActionRegistry:
         self._metrics = metrics
         self._actions: dict[str, ActionHandler] = {}
         self._metadata: dict[str, ActionMetadata] = {}
+        self._sorted_metadata: list[ActionMetadata] | None = None
+        self._validators: dict[str, PayloadValidator] = {}
         self._register_defaults()
 
     def register(
@@ -39,17 +43,29 @@ class ActionRegistry:
         payload_schema: dict[str, Any] | None = None,
     ) -> None:
         """Register an action with optional metadata."""
+        name = sys.intern(name)
         self._actions[name] = handler
+        payload_schema = payload_schema or {}
+        # Always recompile: the caller may have mutated the schema in place
+        self._validators[name] = compile_payload_validator(payload_schema)
+        # Re-registering with identical metadata (plugin reloads) keeps the
+        # existing object and the cached sorted listing
+        existing = self._metadata.get(name)
+        if (
+            existing is not None
+            and existing.description == description
+            and existing.payload_schema == payload_schema
+        ):
+            return
         self._metadata[name] = ActionMetadata(
             name=name,
             description=description,
-            payload_schema=payload_schema or {},
+            payload_schema=payload_schema,
         )
+        self._sorted_metadata = None
 
     async def run(self, name: str, payload: dict[str, object]) -> None:
-        handler = self._actions.get(name)
-        if handler is None:
-            raise KeyError(name)
+        handler = self._actions[name]  # KeyError for unknown names
         try:
             await handler(payload)
         except Exception:
@@ -61,12 +77,24 @@ class ActionRegistry:
 
     def list_actions(self) -> list[ActionMetadata]:
         """List all registered actions with metadata."""
-        return [self._metadata[name] for name in sorted(self._actions.keys())]
+        if self._sorted_metadata is None:
+            self._sorted_metadata = [
+                self._metadata[name] for name in sorted(self._actions)
+            ]
+        return list(self._sorted_metadata)
 
     def get_action_metadata(self, name: str) -> ActionMetadata | None:
         """Get metadata for a specific action."""
         return self._metadata.get(name)
 
+    def validate_payload(self, name: str, payload: dict[str, object]) -> list[str]:
+        """Validate *payload* against the schema registered for *name*.
+
+        Uses the validator compiled at registration. Returns a list of error
+        strings (empty when valid); raises KeyError for unknown names.
+        """
+        return self._validators[name](payload)
+
     def _register_defaults(self) -> None:
         async def start_agent(payload: dict[str, object]) -> None:
             agent_id = payload.get("agent_id")
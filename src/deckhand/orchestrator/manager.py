@@ -15,10 +15,11 @@ class Orchestrator:
         self,
         state_persist_path: str | None = None,
         metrics: Metrics | None = None,
+        event_batch_window: float = 0.0,
     ) -> None:
         self.agents: dict[str, AgentBase] = {}
         self.metrics = metrics
-        self.event_bus = EventBus(metrics=metrics)
+        self.event_bus = EventBus(metrics=metrics, batch_window=event_batch_window)
         self.state_store = StateStore(self.event_bus, persist_path=state_persist_path)
 
     def register_agent(self, agent: AgentBase) -> None:
@@ -6,7 +6,7 @@ from dataclasses import dataclass, field
 from typing import Any
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ActionMetadata:
     """Metadata for a registered action."""
 
@@ -15,7 +15,7 @@ class ActionMetadata:
     payload_schema: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SignalMetadata:
     """Metadata for a registered signal."""
 
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import sys
 from typing import Any, Awaitable, Callable
 
 from deckhand.metrics import Metrics
 from deckhand.orchestrator.metadata import SignalMetadata
+from deckhand.security import PayloadValidator, compile_payload_validator
 
 
 SignalHandler = Callable[[dict[str, object]], Awaitable[None]]
@@ -15,6 +17,8 @@ class SignalRegistry:
     def __init__(self, metrics: Metrics | None = None) -> None:
         self._signals: dict[str, SignalHandler] = {}
         self._metadata: dict[str, SignalMetadata] = {}
+        self._sorted_metadata: list[SignalMetadata] | None = None
+        self._validators: dict[str, PayloadValidator] = {}
         self._metrics = metrics
 
     def register(
@@ -25,25 +29,49 @@ class SignalRegistry:
         payload_schema: dict[str, Any] | None = None,
     ) -> None:
         """Register a signal with optional metadata."""
+        name = sys.intern(name)
         self._signals[name] = handler
+        payload_schema = payload_schema or {}
+        # Always recompile: the caller may have mutated the schema in place
+        self._validators[name] = compile_payload_validator(payload_schema)
+        # Re-registering with identical metadata (plugin reloads) keeps the
+        # existing object and the cached sorted listing
+        existing = self._metadata.get(name)
+        if (
+            existing is not None
+            and existing.description == description
+            and existing.payload_schema == payload_schema
+        ):
+            return
         self._metadata[name] = SignalMetadata(
             name=name,
             description=description,
-            payload_schema=payload_schema or {},
+            payload_schema=payload_schema,
         )
+        self._sorted_metadata = None
 
     async def handle(self, name: str, payload: dict[str, object]) -> None:
-        handler = self._signals.get(name)
-        if handler is None:
-            raise KeyError(name)
+        handler = self._signals[name]  # KeyError for unknown names
         await handler(payload)
         if self._metrics is not None:
             self._metrics.record_signal(name)
 
     def list_signals(self) -> list[SignalMetadata]:
         """List all registered signals with metadata."""
-        return [self._metadata[name] for name in sorted(self._signals.keys())]
+        if self._sorted_metadata is None:
+            self._sorted_metadata = [
+                self._metadata[name] for name in sorted(self._signals)
+            ]
+        return list(self._sorted_metadata)
 
     def get_signal_metadata(self, name: str) -> SignalMetadata | None:
         """Get metadata for a specific signal."""
         return self._metadata.get(name)
+
+    def validate_payload(self, name: str, payload: dict[str, object]) -> list[str]:
+        """Validate *payload* against the schema registered for *name*.
+
+        Uses the validator compiled at registration. Returns a list of error
+        strings (empty when valid); raises KeyError for unknown names.
+        """
+        return self._validators[name](payload)
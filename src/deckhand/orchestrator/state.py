@@ -1,32 +1,62 @@
 from __future__ import annotations
 
 import asyncio
+import heapq
 import json
 import logging
 import os
-import time
 from pathlib import Path
+from time import time as _time
 from typing import Any
 
 from deckhand.orchestrator.events import EventBus, build_event
 
+try:  # orjson is optional; it makes large state files much cheaper to load/save
+    import orjson
+
+    def _dumps(entries: list[dict[str, Any]]) -> bytes:
+        return orjson.dumps(entries, default=str, option=orjson.OPT_NON_STR_KEYS)
+
+    _loads = orjson.loads
+except ImportError:
+
+    def _dumps(entries: list[dict[str, Any]]) -> bytes:
+        return json.dumps(entries, default=str).encode()
+
+    _loads = json.loads
+
 logger = logging.getLogger(__name__)
 
 # Minimum interval between persistence writes (seconds)
 _SAVE_DEBOUNCE = 1.0
 
+# Stale expiry heap entries tolerated beyond 2x the live entry count
+_EXPIRY_HEAP_SLACK = 64
+
+_EXPIRY_SOURCE = {"kind": "state", "id": "expiry"}
+
 
 class StateStore:
     """In-memory state store for UI indicators and signals.
 
     Optionally persists state to a JSON file so it survives service restarts.
+    ``updated_at`` and ``expires_at`` are wall-clock (epoch) timestamps, since
+    they are persisted and returned to API clients.
     """
 
     def __init__(self, event_bus: EventBus, persist_path: str | None = None) -> None:
         self._event_bus = event_bus
         self._state: dict[str, dict[str, Any]] = {}
+        # (expires_at, key) for every TTL'd write; entries whose expires_at no
+        # longer matches the live entry are stale and skipped when popped
+        self._expiry_heap: list[tuple[float, str]] = []
+        # Fires at the earliest deadline so expiry events don't wait for a read
+        self._expiry_timer: asyncio.TimerHandle | None = None
+        self._expiry_timer_at: float = 0.0
         self._persist_path = Path(persist_path) if persist_path else None
         self._save_task: asyncio.Task[None] | None = None
+        # Background broadcasts in flight; held so they can't be collected
+        self._emit_tasks: set[asyncio.Task[None]] = set()
         self._last_save: float = 0.0
 
         # Load persisted state on init
@@ -60,8 +90,14 @@ class StateStore:
         return list(self._state.values())
 
     def get_state(self, key: str) -> dict[str, Any] | None:
-        self._purge_expired()
-        return self._state.get(key)
+        entry = self._state.get(key)
+        if entry is None:
+            return None
+        expires_at = entry.get("expires_at")
+        if expires_at is not None and expires_at <= _time():
+            self._purge_expired()
+            return None
+        return entry
 
     async def set_state(
         self,
@@ -70,15 +106,7 @@ class StateStore:
         ttl_seconds: float | None = None,
         source: dict[str, str] | None = None,
     ) -> None:
-        now = time.time()
-        expires_at = now + ttl_seconds if ttl_seconds is not None else None
-        entry = {
-            "key": key,
-            "value": value,
-            "updated_at": now,
-            "expires_at": expires_at,
-        }
-        self._state[key] = entry
+        entry = self._write_entry(key, value, ttl_seconds)
         await self._event_bus.emit(
             build_event(
                 "state.changed",
@@ -88,9 +116,88 @@ class StateStore:
         )
         self._schedule_save()
 
+    def set_state_sync(
+        self,
+        key: str,
+        value: Any,
+        ttl_seconds: float | None = None,
+        source: dict[str, str] | None = None,
+    ) -> dict[str, Any]:
+        """Set state without awaiting the ``state.changed`` broadcast.
+
+        The entry is written immediately and the event is emitted from a
+        background task, so callers writing in tight bursts don't wait on
+        subscribers. Use ``set_state`` when ordering against later events
+        matters. Returns the stored entry.
+        """
+        entry = self._write_entry(key, value, ttl_seconds)
+        self._emit_in_background(
+            build_event("state.changed", source or {"kind": "state", "id": key}, entry)
+        )
+        self._schedule_save()
+        return entry
+
+    async def set_state_and_emit(
+        self,
+        key: str,
+        value: Any,
+        event: dict[str, Any],
+        ttl_seconds: float | None = None,
+        source: dict[str, str] | None = None,
+    ) -> None:
+        """Set state and emit a companion event in one broadcast.
+
+        Subscribers receive the ``state.changed`` event followed by *event*,
+        sent together instead of as two separate emissions. *event* is
+        validated before the store is touched, so an invalid companion
+        event leaves the state unchanged.
+        """
+        self._event_bus.validate(event)
+        entry = self._write_entry(key, value, ttl_seconds)
+        await self._event_bus.emit_many(
+            (
+                build_event(
+                    "state.changed",
+                    source or {"kind": "state", "id": key},
+                    entry,
+                ),
+                event,
+            )
+        )
+        self._schedule_save()
+
+    def _write_entry(
+        self, key: str, value: Any, ttl_seconds: float | None
+    ) -> dict[str, Any]:
+        now = _time()
+        expires_at = now + ttl_seconds if ttl_seconds is not None else None
+        entry = {
+            "key": key,
+            "value": value,
+            "updated_at": now,
+            "expires_at": expires_at,
+        }
+        self._state[key] = entry
+        if expires_at is not None:
+            heapq.heappush(self._expiry_heap, (expires_at, key))
+            # Keys rewritten before they expire leave stale heap entries;
+            # rebuild once they outnumber the live entries
+            if len(self._expiry_heap) > 2 * len(self._state) + _EXPIRY_HEAP_SLACK:
+                self._rebuild_expiry_heap()
+            if self._expiry_heap[0][1] == key:
+                self._arm_expiry_timer()
+        return entry
+
+    def _rebuild_expiry_heap(self) -> None:
+        self._expiry_heap = [
+            (e["expires_at"], key)
+            for key, e in self._state.items()
+            if e.get("expires_at") is not None
+        ]
+        heapq.heapify(self._expiry_heap)
+
     async def clear_state(self, key: str, source: dict[str, str] | None = None) -> None:
-        if key in self._state:
-            del self._state[key]
+        self._state.pop(key, None)
         await self._event_bus.emit(
             build_event(
                 "state.cleared",
@@ -101,31 +208,63 @@ class StateStore:
         self._schedule_save()
 
     def _purge_expired(self) -> None:
-        now = time.time()
-        expired = [
-            key
-            for key, entry in self._state.items()
-            if entry.get("expires_at") is not None and entry["expires_at"] <= now
-        ]
-        for key in expired:
-            del self._state[key]
-            # Emit state.cleared event for expired key
-            # Use asyncio.create_task to schedule emission without blocking
-            try:
-                asyncio.get_running_loop()
-                asyncio.create_task(
-                    self._event_bus.emit(
-                        build_event(
-                            "state.cleared",
-                            {"kind": "state", "id": key},
-                            {"key": key},
-                        )
-                    )
-                )
-            except RuntimeError:
-                # No running event loop, skip event emission
-                # This can happen in tests or non-async contexts
-                pass
+        now = _time()
+        heap = self._expiry_heap
+        expired = []
+        while heap and heap[0][0] <= now:
+            expires_at, key = heapq.heappop(heap)
+            entry = self._state.get(key)
+            if entry is not None and entry.get("expires_at") == expires_at:
+                del self._state[key]
+                expired.append(key)
+        self._arm_expiry_timer()
+        if not expired:
+            return
+
+        # Report every key that expired in this pass as one state.expired
+        # event, in the background so the read that noticed them isn't blocked
+        self._emit_in_background(
+            build_event("state.expired", _EXPIRY_SOURCE, {"keys": expired, "ts": now})
+        )
+
+    def _emit_in_background(self, event: dict[str, Any]) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No running event loop, skip event emission
+            # This can happen in tests or non-async contexts
+            return
+        task = loop.create_task(self._event_bus.emit(event))
+        self._emit_tasks.add(task)
+        task.add_done_callback(self._on_emit_done)
+
+    def _on_emit_done(self, task: asyncio.Task[None]) -> None:
+        self._emit_tasks.discard(task)
+        if not task.cancelled() and (exc := task.exception()) is not None:
+            logger.error("Background state event failed", exc_info=exc)
+
+    def _arm_expiry_timer(self) -> None:
+        """(Re)schedule the purge timer for the earliest pending deadline."""
+        deadline = self._expiry_heap[0][0] if self._expiry_heap else None
+        if self._expiry_timer is not None:
+            if deadline == self._expiry_timer_at:
+                return
+            self._expiry_timer.cancel()
+            self._expiry_timer = None
+        if deadline is None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # Purged on the next read instead
+        self._expiry_timer = loop.call_later(
+            max(deadline - _time(), 0.0), self._on_expiry_timer
+        )
+        self._expiry_timer_at = deadline
+
+    def _on_expiry_timer(self) -> None:
+        self._expiry_timer = None
+        self._purge_expired()
 
     # ----- Persistence -----
 
@@ -134,15 +273,19 @@ class StateStore:
         if not self._persist_path or not self._persist_path.exists():
             return
         try:
-            data = json.loads(self._persist_path.read_text())
-            now = time.time()
-            for entry in data:
-                expires_at = entry.get("expires_at")
-                if expires_at is not None and expires_at <= now:
-                    continue  # Skip expired
-                key = entry.get("key")
-                if key:
-                    self._state[key] = entry
+            data = _loads(self._persist_path.read_bytes())
+            now = _time()
+            # Keep keyed entries that haven't expired yet
+            self._state.update(
+                {
+                    e["key"]: e
+                    for e in data
+                    if e.get("key")
+                    and (e.get("expires_at") is None or e["expires_at"] > now)
+                }
+            )
+            self._rebuild_expiry_heap()
+            self._arm_expiry_timer()
             logger.info(
                 "Loaded %d state entries from %s", len(self._state), self._persist_path
             )
@@ -167,7 +310,7 @@ class StateStore:
 
     async def _debounced_save(self) -> None:
         """Wait for debounce interval then save."""
-        elapsed = time.time() - self._last_save
+        elapsed = _time() - self._last_save
         if elapsed < _SAVE_DEBOUNCE:
             await asyncio.sleep(_SAVE_DEBOUNCE - elapsed)
         self._save_sync()
@@ -179,13 +322,13 @@ class StateStore:
         try:
             self._persist_path.parent.mkdir(parents=True, exist_ok=True)
             # Only persist non-expired entries
-            now = time.time()
+            now = _time()
             entries = [
                 e
                 for e in self._state.values()
                 if e.get("expires_at") is None or e["expires_at"] > now
             ]
-            self._persist_path.write_text(json.dumps(entries, default=str))
-            self._last_save = time.time()
+            self._persist_path.write_bytes(_dumps(entries))
+            self._last_save = now
         except Exception:
             logger.exception("Failed to save state to %s", self._persist_path)
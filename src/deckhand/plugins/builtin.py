@@ -4,31 +4,40 @@ from typing import Any
 
 from deckhand.plugins.registry import PluginRegistry
 
+_CAMERA_MOTION_SOURCE = {"kind": "signal", "id": "camera.motion"}
+
+_CAMERA_MOTION_SCHEMA: dict[str, Any] = {
+    "key": {
+        "type": "string",
+        "required": False,
+        "default": "camera.front_door.motion",
+    },
+    "active": {"type": "boolean", "required": False, "default": True},
+    "ttl_seconds": {"type": "number", "required": False},
+}
+
 
 def register(registry: PluginRegistry) -> None:
+    # Defaults (from the declared schema) and the state setter are resolved
+    # once, here, so the handler body is a straight run of lookups
+    default_key = _CAMERA_MOTION_SCHEMA["key"]["default"]
+    default_active = _CAMERA_MOTION_SCHEMA["active"]["default"]
+    set_state = registry.state.set_state
+
     async def camera_motion(payload: dict[str, Any]) -> None:
-        key = str(payload.get("key") or "camera.front_door.motion")
-        active = bool(payload.get("active", True))
-        ttl_seconds = payload.get("ttl_seconds")
-        ttl_value = float(ttl_seconds) if ttl_seconds is not None else None
-        await registry.state.set_state(
-            key,
-            {"active": active},
-            ttl_seconds=ttl_value,
-            source={"kind": "signal", "id": "camera.motion"},
+        get = payload.get
+        key = get("key") or default_key
+        ttl_seconds = get("ttl_seconds")
+        await set_state(
+            key if type(key) is str else str(key),
+            {"active": bool(get("active", default_active))},
+            ttl_seconds=float(ttl_seconds) if ttl_seconds is not None else None,
+            source=_CAMERA_MOTION_SOURCE,
         )
 
     registry.signals.register(
         "camera.motion",
         camera_motion,
         description="Handle camera motion detection webhook",
-        payload_schema={
-            "key": {
-                "type": "string",
-                "required": False,
-                "default": "camera.front_door.motion",
-            },
-            "active": {"type": "boolean", "required": False, "default": True},
-            "ttl_seconds": {"type": "number", "required": False},
-        },
+        payload_schema=_CAMERA_MOTION_SCHEMA,
     )
@@ -18,6 +18,7 @@ Capabilities (cumulative):
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from dataclasses import dataclass
 from typing import Any, Literal
 
@@ -39,7 +40,7 @@ def _deny(capability: str, op: str) -> "PermissionError":
     )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PluginSpec:
     """A plugin module path paired with its declared capability."""
 
@@ -145,6 +146,16 @@ class ScopedStateStore:
             raise _deny(self._capability, "write state")
         return await self._inner.set_state(*args, **kwargs)
 
+    def set_state_sync(self, *args: Any, **kwargs: Any) -> Any:
+        if self._capability == "read-only":
+            raise _deny(self._capability, "write state")
+        return self._inner.set_state_sync(*args, **kwargs)
+
+    async def set_state_and_emit(self, *args: Any, **kwargs: Any) -> Any:
+        if self._capability == "read-only":
+            raise _deny(self._capability, "write state")
+        return await self._inner.set_state_and_emit(*args, **kwargs)
+
     async def clear_state(self, *args: Any, **kwargs: Any) -> Any:
         if self._capability == "read-only":
             raise _deny(self._capability, "write state")
@@ -173,6 +184,11 @@ class ScopedEventBus:
             raise _deny(self._capability, "emit events")
         await self._inner.emit(event)
 
+    async def emit_many(self, events: Iterable[dict[str, Any]]) -> None:
+        if self._capability == "read-only":
+            raise _deny(self._capability, "emit events")
+        await self._inner.emit_many(events)
+
 
 def build_scoped_registry(
     base: PluginRegistry, capability: Capability
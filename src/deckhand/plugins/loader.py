@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import importlib
 import logging
+import sys
+from types import ModuleType
 from typing import Iterable, Union
 
 from deckhand.plugins.capabilities import (
@@ -15,25 +17,43 @@ logger = logging.getLogger(__name__)
 PluginEntry = Union[str, PluginSpec]
 
 
+def _cached_import(module_path: str) -> ModuleType:
+    """Import *module_path*, reusing ``sys.modules`` when fully initialised."""
+    module = sys.modules.get(module_path)
+    if (
+        module is not None
+        and (spec := getattr(module, "__spec__", None)) is not None
+        and not getattr(spec, "_initializing", False)
+    ):
+        return module
+    return importlib.import_module(module_path)
+
+
 def load_plugins(entries: Iterable[PluginEntry], registry: PluginRegistry) -> None:
     """Load and register plugins.
 
     Each entry may be either a module path string (defaults to ``full``
     capability) or a :class:`PluginSpec`. Each plugin receives a registry
-    scoped to its declared capability.
+    scoped to its declared capability. Every module is imported and checked
+    for ``register`` before any plugin is registered.
     """
-    for entry in entries:
-        spec = (
-            entry
-            if isinstance(entry, PluginSpec)
-            else PluginSpec(module=entry, capability="full")
-        )
-        module = importlib.import_module(spec.module)
-        register = getattr(module, "register", None)
+    specs = [
+        entry
+        if isinstance(entry, PluginSpec)
+        else PluginSpec(module=entry, capability="full")
+        for entry in entries
+    ]
+    # Resolve every register() before calling any, so a bad entry late in
+    # the list doesn't leave earlier plugins half-registered
+    resolved = [
+        (spec, getattr(_cached_import(spec.module), "register", None)) for spec in specs
+    ]
+    for spec, register in resolved:
         if register is None:
             raise ValueError(
                 f"Plugin module {spec.module} has no register(registry) function"
             )
+    for spec, register in resolved:
         scoped = build_scoped_registry(registry, spec.capability)
         logger.info(
             "Loading plugin %s with capability=%s", spec.module, spec.capability
@@ -12,7 +12,7 @@ if TYPE_CHECKING:
     from deckhand.orchestrator.manager import Orchestrator
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PluginRegistry:
     actions: ActionRegistry
     signals: SignalRegistry
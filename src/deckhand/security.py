@@ -5,6 +5,7 @@ from __future__ import annotations
 import secrets
 import time
 from collections import defaultdict
+from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any
 
@@ -57,36 +58,55 @@ _TYPE_MAP: dict[str, type | tuple[type, ...]] = {
 }
 
 
-def validate_payload(
-    payload: dict[str, Any], schema: dict[str, Any] | None
-) -> list[str]:
-    """Validate *payload* against a registered action/signal schema.
+PayloadValidator = Callable[[dict[str, Any]], list[str]]
 
-    Returns a list of human-readable error strings (empty when valid).
+
+def compile_payload_validator(schema: dict[str, Any] | None) -> PayloadValidator:
+    """Build a validator for a registered action/signal schema.
+
+    The schema is walked once here; the returned function takes a payload and
+    returns a list of human-readable error strings (empty when valid).
     """
-    if not schema:
-        return []
-
-    errors: list[str] = []
-    for field_name, field_def in schema.items():
-        value = payload.get(field_name)
-        is_required = field_def.get("required", False)
-
-        if value is None:
-            if is_required:
-                errors.append(f"Missing required field: {field_name}")
-            continue
-
-        expected_type = field_def.get("type")
-        if expected_type:
-            python_type = _TYPE_MAP.get(expected_type)
+    fields = tuple(
+        (
+            field_name,
+            bool(field_def.get("required", False)),
+            field_def.get("type"),
+            _TYPE_MAP.get(field_def.get("type")),
+        )
+        for field_name, field_def in (schema or {}).items()
+    )
+    if not fields:
+        return lambda payload: []
+
+    def validate(payload: dict[str, Any]) -> list[str]:
+        errors: list[str] = []
+        get = payload.get
+        for field_name, is_required, expected_type, python_type in fields:
+            value = get(field_name)
+            if value is None:
+                if is_required:
+                    errors.append(f"Missing required field: {field_name}")
+                continue
             if python_type and not isinstance(value, python_type):
                 errors.append(
                     f"Field '{field_name}' expected type '{expected_type}', "
                     f"got '{type(value).__name__}'"
                 )
+        return errors
+
+    return validate
 
-    return errors
+
+def validate_payload(
+    payload: dict[str, Any], schema: dict[str, Any] | None
+) -> list[str]:
+    """Validate *payload* against a registered action/signal schema.
+
+    Returns a list of human-readable error strings (empty when valid).
+    Registries keep a compiled validator per name; this is the one-off form.
+    """
+    return compile_payload_validator(schema)(payload)
 
 
 # ---------------------------------------------------------------------------
@@ -22,8 +22,8 @@ def event_bus() -> EventBus:
 def orchestrator(event_bus: EventBus) -> Orchestrator:
     """Orchestrator instance with mock agents."""
     orch = Orchestrator()
-    orch.register_agent(MockAgent(agent_id="mock-1"))
-    orch.register_agent(MockAgent(agent_id="mock-2"))
+    orch.register_agent(MockAgent(agent_id="mock-1", work_delay=0))
+    orch.register_agent(MockAgent(agent_id="mock-2", work_delay=0))
     return orch
 
 
@@ -0,0 +1,55 @@
+"""Tests for agent base behavior."""
+
+from __future__ import annotations
+
+import asyncio
+
+from deckhand.agents.base import AgentStatus
+from deckhand.agents.mock import MockAgent
+
+
+async def test_as_dict_snapshot_reused_until_change() -> None:
+    """Test as_dict reuses its snapshot until a field in it changes."""
+    agent = MockAgent(agent_id="mock-1", project_root="/home/dev/alpha")
+    first = agent.as_dict()
+    assert agent.as_dict() == first
+    assert agent.as_dict()["display_label"] is first["display_label"]
+
+    # Returned snapshots are copies; mutating one leaves the cache intact
+    first["id"] = "changed"
+    assert agent.as_dict()["id"] == "mock-1"
+    assert isinstance(first["capabilities"], tuple)
+
+    await agent._set_status(AgentStatus.RUNNING)
+    running = agent.as_dict()
+    assert running is not first
+    assert running["status"] == "running"
+    assert first["status"] == "idle"  # Earlier snapshots are left untouched
+
+    agent.project_root = "/home/dev/beta"
+    assert agent.as_dict()["display_label"] == "mock: beta"
+
+    agent.active_file = "main.py"
+    assert agent.as_dict()["active_file"] == "main.py"
+
+
+async def test_mock_agent_lifecycle_without_delay() -> None:
+    """Test a zero work_delay MockAgent runs its lifecycle without waiting."""
+    agent = MockAgent(agent_id="mock-1", work_delay=0)
+    events: list[dict] = []
+
+    async def capture(event: dict) -> None:
+        events.append(event)
+
+    agent.on_event = capture
+    await agent.start()
+    for _ in range(10):
+        if agent.status == AgentStatus.AWAITING_INPUT:
+            break
+        await asyncio.sleep(0)
+    assert agent.status == AgentStatus.AWAITING_INPUT
+
+    await agent.provide_input("yes")
+    await asyncio.wait_for(agent._task, timeout=1.0)
+    assert agent.status == AgentStatus.IDLE
+    assert events[-1]["type"] == "agent.completed"
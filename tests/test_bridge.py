@@ -267,3 +267,29 @@ async def test_agent_without_context_uses_id_as_label(client: AsyncClient) -> No
     data = resp.json()
     assert data["project_root"] is None
     assert data["display_label"] == "bare-agent"
+
+
+def test_events_stream_ignores_client_frames(monkeypatch) -> None:
+    """Client frames on /events are ignored; disconnect unsubscribes."""
+    monkeypatch.setenv("DECKHAND_API_KEY", TEST_API_KEY)
+
+    import importlib
+
+    from starlette.testclient import TestClient
+
+    import deckhand.main as main_mod
+
+    importlib.reload(main_mod)
+    headers = {"Authorization": f"Bearer {TEST_API_KEY}"}
+
+    with TestClient(main_mod.app) as tc:
+        with tc.websocket_connect("/events") as ws:
+            ws.send_json({"type": "auth", "token": TEST_API_KEY})
+            assert ws.receive_json()["type"] == "auth_ok"
+
+            ws.send_text("hello")
+            ws.send_bytes(b"\x00\x01")
+            tc.post("/agents/nonexistent/start", headers=headers)
+            assert ws.receive_json()["type"] == "error"
+
+        assert main_mod.orchestrator.event_bus.client_count == 0
@@ -0,0 +1,42 @@
+"""Tests for config file loading."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from deckhand.config.loader import load_config
+from deckhand.config.settings import Settings
+
+
+def test_load_config_reparses_only_on_change(tmp_path: Path) -> None:
+    """Test an unchanged config file is served from cache and edits are picked up."""
+    path = tmp_path / "config.toml"
+    path.write_text("[service]\nport = 8000\n")
+
+    first = load_config(path)
+    assert first["service"]["port"] == 8000
+    assert load_config(path) is first
+
+    path.write_text("[service]\nport = 9001\n")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert load_config(path)["service"]["port"] == 9001
+
+
+def test_load_config_missing_file(tmp_path: Path) -> None:
+    """Test a missing config file loads as empty."""
+    assert load_config(tmp_path / "missing.toml") == {}
+
+
+def test_settings_env_overrides_config_file(tmp_path: Path, monkeypatch) -> None:
+    """Test DECKHAND_CONFIG_FILE is loaded and other env vars override it."""
+    path = tmp_path / "config.toml"
+    path.write_text('[service]\nhost = "0.0.0.0"\nport = 8000\n')
+    monkeypatch.setenv("DECKHAND_CONFIG_FILE", str(path))
+    monkeypatch.setenv("DECKHAND_PORT", "9002")
+
+    settings = Settings()
+    assert settings.config_file_path == str(path)
+    assert settings.host == "0.0.0.0"
+    assert settings.port == 9002
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import json
 
 import pytest
 
@@ -18,8 +19,8 @@ async def test_websocket_subscription() -> None:
         async def accept(self) -> None:
             pass
 
-        async def send_json(self, data: dict) -> None:
-            received.append(data)
+        async def send_text(self, data: str) -> None:
+            received.append(json.loads(data))
 
     ws1 = MockWebSocket()
     ws2 = MockWebSocket()
@@ -54,8 +55,8 @@ async def test_event_emission_multiple_subscribers() -> None:
         async def accept(self) -> None:
             pass
 
-        async def send_json(self, data: dict) -> None:
-            self.received_list.append(data)
+        async def send_text(self, data: str) -> None:
+            self.received_list.append(json.loads(data))
 
     ws1 = MockWebSocket(received_ws1)
     ws2 = MockWebSocket(received_ws2)
@@ -72,6 +73,39 @@ async def test_event_emission_multiple_subscribers() -> None:
     assert received_ws1[0] == received_ws2[0]
 
 
+async def test_event_encoded_once_for_all_subscribers(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test an event is serialized once and the same frame sent to everyone."""
+    from deckhand.orchestrator import events as events_module
+
+    bus = EventBus()
+    frames: list[str] = []
+    encode_calls = []
+    encode = events_module._encode
+
+    def counting_encode(event: dict) -> str:
+        encode_calls.append(event)
+        return encode(event)
+
+    monkeypatch.setattr(events_module, "_encode", counting_encode)
+
+    class MockWebSocket:
+        async def accept(self) -> None:
+            pass
+
+        async def send_text(self, data: str) -> None:
+            frames.append(data)
+
+    for _ in range(3):
+        await bus.subscribe(MockWebSocket())
+    await bus.emit(build_event("test.event", {"kind": "test", "id": "1"}, {}))
+
+    assert len(encode_calls) == 1
+    assert len(frames) == 3
+    assert all(frame is frames[0] for frame in frames)
+
+
 async def test_dead_subscriber_cleanup() -> None:
     """Test dead subscriber cleanup."""
     bus = EventBus()
@@ -84,10 +118,10 @@ async def test_dead_subscriber_cleanup() -> None:
         async def accept(self) -> None:
             pass
 
-        async def send_json(self, data: dict) -> None:
+        async def send_text(self, data: str) -> None:
             if self.should_fail:
                 raise Exception("Connection closed")
-            received.append(data)
+            received.append(json.loads(data))
 
     ws1 = MockWebSocket(should_fail=True)
     ws2 = MockWebSocket(should_fail=False)
@@ -103,6 +137,32 @@ async def test_dead_subscriber_cleanup() -> None:
     assert len(bus._subscribers) == 1  # ws1 was removed
 
 
+async def test_subscribers_sent_concurrently() -> None:
+    """Test a slow subscriber does not hold up delivery to the others."""
+    bus = EventBus()
+    fast_received = asyncio.Event()
+
+    class SlowWebSocket:
+        async def accept(self) -> None:
+            pass
+
+        async def send_text(self, data: str) -> None:
+            await asyncio.wait_for(fast_received.wait(), timeout=1.0)
+
+    class FastWebSocket:
+        async def accept(self) -> None:
+            pass
+
+        async def send_text(self, data: str) -> None:
+            fast_received.set()
+
+    await bus.subscribe(SlowWebSocket())
+    await bus.subscribe(FastWebSocket())
+
+    await bus.emit(build_event("test.event", {"kind": "test", "id": "1"}, {}))
+    assert bus.client_count == 2  # Slow socket finished rather than timing out
+
+
 async def test_event_envelope_validation() -> None:
     """Test event envelope structure validation."""
     bus = EventBus()
@@ -111,7 +171,7 @@ async def test_event_envelope_validation() -> None:
         async def accept(self) -> None:
             pass
 
-        async def send_json(self, data: dict) -> None:
+        async def send_text(self, data: str) -> None:
             pass
 
     ws = MockWebSocket()
@@ -148,3 +208,83 @@ async def test_build_error_event() -> None:
     assert error_event["payload"]["error_type"] == "ValidationError"
     assert error_event["payload"]["message"] == "Missing required field"
     assert error_event["payload"]["details"]["field"] == "test_field"
+
+
+async def test_emit_many_validates_before_sending() -> None:
+    """Test emit_many sends nothing if any event in the batch is invalid."""
+    bus = EventBus()
+    received = []
+
+    class MockWebSocket:
+        async def accept(self) -> None:
+            pass
+
+        async def send_text(self, data: str) -> None:
+            received.append(json.loads(data))
+
+    await bus.subscribe(MockWebSocket())
+
+    valid = build_event("test.event", {"kind": "test", "id": "1"}, {})
+    with pytest.raises(ValueError, match="missing required fields"):
+        await bus.emit_many([valid, {"type": "test"}])
+    assert received == []
+
+    await bus.emit_many(
+        [valid, build_event("test.event2", {"kind": "test", "id": "2"})]
+    )
+    assert [event["type"] for event in received] == ["test.event", "test.event2"]
+
+
+async def test_batch_window_coalesces_events() -> None:
+    """Test events inside the batch window arrive as one JSON array frame."""
+    bus = EventBus(batch_window=0.01)
+    frames: list[str] = []
+
+    class MockWebSocket:
+        async def accept(self) -> None:
+            pass
+
+        async def send_text(self, data: str) -> None:
+            frames.append(data)
+
+    await bus.subscribe(MockWebSocket())
+
+    for i in range(3):
+        await bus.emit(build_event("test.event", {"kind": "test", "id": str(i)}, {}))
+    assert frames == []
+
+    await asyncio.sleep(0.05)
+    assert len(frames) == 1
+    assert [event["source"]["id"] for event in json.loads(frames[0])] == ["0", "1", "2"]
+
+    # An error flushes straight away, together with anything still pending
+    await bus.emit(build_event("test.event", {"kind": "test", "id": "3"}, {}))
+    await bus.emit(build_error_event("TestError", "boom", {"kind": "test", "id": "4"}))
+    assert [event["type"] for event in json.loads(frames[1])] == ["test.event", "error"]
+
+
+async def test_batch_window_late_subscriber_and_flush() -> None:
+    """Test a mid-window subscriber skips earlier events and flush() delivers."""
+    bus = EventBus(batch_window=60.0)
+    early: list[str] = []
+    late: list[str] = []
+
+    class MockWebSocket:
+        def __init__(self, frames: list[str]) -> None:
+            self.frames = frames
+
+        async def accept(self) -> None:
+            pass
+
+        async def send_text(self, data: str) -> None:
+            self.frames.append(data)
+
+    await bus.subscribe(MockWebSocket(early))
+    await bus.emit(build_event("test.event", {"kind": "test", "id": "0"}, {}))
+    await bus.subscribe(MockWebSocket(late))
+    await bus.emit(build_event("test.event", {"kind": "test", "id": "1"}, {}))
+    assert early == late == []
+
+    await bus.flush()
+    assert [event["source"]["id"] for event in json.loads(early[0])] == ["0", "1"]
+    assert json.loads(late[0])["source"]["id"] == "1"
@@ -5,6 +5,7 @@ from __future__ import annotations
 import pytest
 
 from deckhand.config.settings import _parse_plugin_entry
+from deckhand.orchestrator.events import build_event
 from deckhand.plugins.capabilities import (
     PluginSpec,
     build_scoped_registry,
@@ -41,6 +42,10 @@ async def test_read_only_denies_all_writes(
         scoped.signals.register("evil.signal", noop)
     with pytest.raises(PermissionError):
         await scoped.state.set_state("k", {"v": 1})
+    with pytest.raises(PermissionError):
+        await scoped.state.set_state_and_emit("k", {"v": 1}, {})
+    with pytest.raises(PermissionError):
+        scoped.state.set_state_sync("k", {"v": 1})
     with pytest.raises(PermissionError):
         await scoped.events.emit(
             {
@@ -51,6 +56,8 @@ async def test_read_only_denies_all_writes(
                 "version": "1.0",
             }
         )
+    with pytest.raises(PermissionError):
+        await scoped.events.emit_many([])
     with pytest.raises(PermissionError):
         await scoped.actions.run("agent.start", {"agent_id": "mock-1"})
 
@@ -97,6 +104,14 @@ async def test_state_only_allows_state_and_signals_but_not_actions(
         e.get("value", {}).get("v") == 1 for e in plugin_registry.state.list_state()
     )
 
+    # Event emission allowed, including batched emits
+    await scoped.events.emit_many(
+        [
+            build_event("x", {"kind": "test", "id": "t"}),
+            build_event("y", {"kind": "test", "id": "t"}),
+        ]
+    )
+
     # Actions registration still denied
     with pytest.raises(PermissionError):
         scoped.actions.register("evil.action", noop)
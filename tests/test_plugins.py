@@ -50,6 +50,42 @@ async def test_plugin_loading_missing_register() -> None:
             sys.path.remove(tmpdir)
 
 
+async def test_plugin_loading_reuses_imported_module(
+    plugin_registry: PluginRegistry, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test an already-imported plugin module is taken from sys.modules."""
+    import sys
+    from importlib.machinery import ModuleSpec
+    from types import ModuleType
+
+    module = ModuleType("preloaded_plugin")
+    module.__spec__ = ModuleSpec("preloaded_plugin", None)
+    calls: list[PluginRegistry] = []
+    module.register = calls.append  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "preloaded_plugin", module)
+    monkeypatch.setattr(
+        importlib, "import_module", lambda name: pytest.fail(f"imported {name}")
+    )
+
+    load_plugins(["preloaded_plugin"], plugin_registry)
+    assert len(calls) == 1
+
+
+async def test_plugin_loading_validates_all_before_registering(
+    plugin_registry: PluginRegistry, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test a bad entry late in the list stops earlier plugins registering."""
+    import sys
+    from types import ModuleType
+
+    monkeypatch.setitem(sys.modules, "no_register_plugin", ModuleType("x"))
+    with pytest.raises(ValueError, match="has no register"):
+        load_plugins(
+            ["deckhand.plugins.builtin", "no_register_plugin"], plugin_registry
+        )
+    assert plugin_registry.signals.get_signal_metadata("camera.motion") is None
+
+
 async def test_builtin_plugin_registration(plugin_registry: PluginRegistry) -> None:
     """Test builtin plugin registration."""
     from deckhand.plugins.builtin import register
@@ -25,6 +25,86 @@ async def test_signal_registration(signal_registry: SignalRegistry) -> None:
     assert signals[0].name == "test.signal"
 
 
+async def test_signal_list_sorted_after_register(
+    signal_registry: SignalRegistry,
+) -> None:
+    """Test list_signals stays sorted and picks up signals registered later."""
+
+    async def noop(payload: dict[str, object]) -> None:
+        pass
+
+    signal_registry.register("b.signal", noop)
+    assert [s.name for s in signal_registry.list_signals()] == ["b.signal"]
+    signal_registry.register("a.signal", noop)
+    assert [s.name for s in signal_registry.list_signals()] == [
+        "a.signal",
+        "b.signal",
+    ]
+
+
+async def test_signal_reregister_reuses_metadata(
+    signal_registry: SignalRegistry,
+) -> None:
+    """Test re-registering identical metadata keeps the existing object."""
+
+    async def noop(payload: dict[str, object]) -> None:
+        pass
+
+    signal_registry.register("test.signal", noop, description="Test")
+    first = signal_registry.get_signal_metadata("test.signal")
+    signal_registry.register("test.signal", noop, description="Test")
+    assert signal_registry.get_signal_metadata("test.signal") is first
+
+    signal_registry.register("test.signal", noop, description="Changed")
+    updated = signal_registry.get_signal_metadata("test.signal")
+    assert updated is not first
+    assert signal_registry.list_signals() == [updated]
+
+
+async def test_signal_payload_validated_against_schema(
+    signal_registry: SignalRegistry,
+) -> None:
+    """Test payloads are checked with the validator compiled at register."""
+
+    async def noop(payload: dict[str, object]) -> None:
+        pass
+
+    signal_registry.register(
+        "test.signal",
+        noop,
+        payload_schema={
+            "key": {"type": "string", "required": True},
+            "ttl_seconds": {"type": "number", "required": False},
+        },
+    )
+    assert signal_registry.validate_payload("test.signal", {"key": "k"}) == []
+    assert signal_registry.validate_payload("test.signal", {"ttl_seconds": "x"}) == [
+        "Missing required field: key",
+        "Field 'ttl_seconds' expected type 'number', got 'str'",
+    ]
+    with pytest.raises(KeyError):
+        signal_registry.validate_payload("missing.signal", {})
+
+
+async def test_signal_reregister_recompiles_mutated_schema(
+    signal_registry: SignalRegistry,
+) -> None:
+    """Test re-registering picks up a schema dict mutated in place."""
+
+    async def noop(payload: dict[str, object]) -> None:
+        pass
+
+    schema = {"key": {"type": "string", "required": False}}
+    signal_registry.register("test.signal", noop, payload_schema=schema)
+    assert signal_registry.validate_payload("test.signal", {}) == []
+
+    schema["key"]["required"] = True
+    signal_registry.register("test.signal", noop, payload_schema=schema)
+    assert signal_registry.validate_payload("test.signal", {}) == [
+        "Missing required field: key"
+    ]
+
+
 async def test_signal_handling_valid(signal_registry: SignalRegistry) -> None:
     """Test signal handling with valid payload."""
     handled = []
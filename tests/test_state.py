@@ -3,12 +3,17 @@
 from __future__ import annotations
 
 import asyncio
+import json
+import time
 
-from deckhand.orchestrator.events import EventBus
+import pytest
+
+from deckhand.orchestrator import state as state_module
+from deckhand.orchestrator.events import EventBus, build_event
 from deckhand.orchestrator.state import StateStore
 
 
-# Shared mock WebSocket that implements both accept() and send_json()
+# Shared mock WebSocket that implements both accept() and send_text()
 class MockWebSocket:
     """Mock WebSocket for testing EventBus subscriptions."""
 
@@ -19,9 +24,9 @@ class MockWebSocket:
         """No-op accept method for EventBus.subscribe()."""
         pass
 
-    async def send_json(self, data: dict) -> None:
+    async def send_text(self, data: str) -> None:
         """Capture events sent to the WebSocket."""
-        self.received_events.append(data)
+        self.received_events.append(json.loads(data))
 
 
 async def test_state_set_get(event_bus: EventBus) -> None:
@@ -76,6 +81,23 @@ async def test_state_changed_event(event_bus: EventBus) -> None:
     assert event["version"] == "1.0"
 
 
+async def test_state_set_sync_emits_in_background(event_bus: EventBus) -> None:
+    """Test set_state_sync writes immediately and emits state.changed later."""
+    store = StateStore(event_bus)
+    mock_ws = MockWebSocket()
+    await event_bus.subscribe(mock_ws)
+
+    entry = store.set_state_sync("test.key", {"v": 1})
+    assert store.get_state("test.key") is entry
+    assert mock_ws.received_events == []
+    assert len(store._emit_tasks) == 1  # Held until the broadcast finishes
+
+    await asyncio.sleep(0.01)  # Allow the background emission to run
+    assert [e["type"] for e in mock_ws.received_events] == ["state.changed"]
+    assert not store._emit_tasks
+    assert mock_ws.received_events[0]["payload"]["value"] == {"v": 1}
+
+
 async def test_state_cleared_event(event_bus: EventBus) -> None:
     """Test state.cleared event emission on clear."""
     store = StateStore(event_bus)
@@ -113,3 +135,133 @@ async def test_state_expired_purge_on_get(event_bus: EventBus) -> None:
     await asyncio.sleep(0.15)
     entry = store.get_state("test.key")
     assert entry is None
+
+
+async def test_state_expiry_emits_expired_event(
+    event_bus: EventBus, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test keys expiring together are reported in one state.expired event."""
+    store = StateStore(event_bus)
+    mock_ws = MockWebSocket()
+    await event_bus.subscribe(mock_ws)
+
+    # Pin the clock so all three keys share a deadline
+    now = time.time()
+    monkeypatch.setattr(state_module, "_time", lambda: now)
+    for key in ("a", "b", "c"):
+        await store.set_state(key, 1, ttl_seconds=0.05)
+    monkeypatch.undo()
+    mock_ws.received_events.clear()
+
+    await asyncio.sleep(0.1)  # No reads: the expiry timer does the purge
+    assert len(mock_ws.received_events) == 1
+    event = mock_ws.received_events[0]
+    assert event["type"] == "state.expired"
+    assert event["source"] == {"kind": "state", "id": "expiry"}
+    assert event["payload"]["keys"] == ["a", "b", "c"]
+    assert store._state == {}
+
+
+async def test_state_overwrite_replaces_ttl(event_bus: EventBus) -> None:
+    """Test rewriting a key drops its old deadline."""
+    store = StateStore(event_bus)
+    await store.set_state("short", {"v": 1}, ttl_seconds=0.05)
+    await store.set_state("short", {"v": 2})  # Now permanent
+    await store.set_state("extended", {"v": 1}, ttl_seconds=0.05)
+    await store.set_state("extended", {"v": 2}, ttl_seconds=10)
+
+    await asyncio.sleep(0.1)
+    assert store.get_state("short")["value"] == {"v": 2}
+    assert store.get_state("extended")["value"] == {"v": 2}
+
+
+async def test_set_state_and_emit_sends_both_events(event_bus: EventBus) -> None:
+    """Test set_state_and_emit sends state.changed then the companion event."""
+    store = StateStore(event_bus)
+
+    mock_ws = MockWebSocket()
+    await event_bus.subscribe(mock_ws)
+
+    await store.set_state_and_emit(
+        "lights.den.state",
+        {"on": True},
+        build_event("lights.changed", {"kind": "action", "id": "lights.on"}, {}),
+        source={"kind": "action", "id": "lights.on"},
+    )
+
+    assert store.get_state("lights.den.state")["value"] == {"on": True}
+    types = [event["type"] for event in mock_ws.received_events]
+    assert types == ["state.changed", "lights.changed"]
+
+
+async def test_set_state_and_emit_invalid_event_leaves_state(
+    event_bus: EventBus,
+) -> None:
+    """Test an invalid companion event is rejected before the store is written."""
+    store = StateStore(event_bus)
+    await store.set_state("lights.den.state", {"on": False})
+
+    mock_ws = MockWebSocket()
+    await event_bus.subscribe(mock_ws)
+
+    with pytest.raises(ValueError):
+        await store.set_state_and_emit(
+            "lights.den.state", {"on": True}, {"type": "lights.changed"}
+        )
+
+    assert store.get_state("lights.den.state")["value"] == {"on": False}
+    assert mock_ws.received_events == []
+
+
+def test_state_load_skips_expired_and_keyless(tmp_path, event_bus: EventBus) -> None:
+    """Test loading persisted state drops expired and keyless entries."""
+    path = tmp_path / "state.json"
+    path.write_text(
+        json.dumps(
+            [
+                {"key": "live", "value": 1, "updated_at": 0, "expires_at": None},
+                {"key": "stale", "value": 2, "updated_at": 0, "expires_at": 1.0},
+                {"value": 3, "updated_at": 0, "expires_at": None},
+            ]
+        )
+    )
+    store = StateStore(event_bus, persist_path=str(path))
+    assert [entry["key"] for entry in store.list_state()] == ["live"]
+
+
+async def test_state_load_arms_expiry_timer(tmp_path, event_bus: EventBus) -> None:
+    """Test a loaded expiring key is purged without being read again."""
+    path = tmp_path / "state.json"
+    path.write_text(
+        json.dumps(
+            [
+                {
+                    "key": "soon",
+                    "value": 1,
+                    "updated_at": 0,
+                    "expires_at": time.time() + 0.05,
+                }
+            ]
+        )
+    )
+    store = StateStore(event_bus, persist_path=str(path))
+    mock_ws = MockWebSocket()
+    await event_bus.subscribe(mock_ws)
+
+    await asyncio.sleep(0.1)
+    assert [event["type"] for event in mock_ws.received_events] == ["state.expired"]
+    assert mock_ws.received_events[0]["payload"]["keys"] == ["soon"]
+    assert store._state == {}
+
+
+async def test_state_persist_round_trip(tmp_path, event_bus: EventBus) -> None:
+    """Test state saved to disk is restored by a new store."""
+    path = tmp_path / "state.json"
+    store = StateStore(event_bus, persist_path=str(path))
+    await store.set_state("lights.den", {"on": True, "brightness": 80})
+    store._save_sync()
+
+    restored = StateStore(event_bus, persist_path=str(path))
+    entry = restored.get_state("lights.den")
+    assert entry is not None
+    assert entry["value"] == {"on": True, "brightness": 80}